@@ -4,9 +4,7 @@ Base Menu Class
 Provides common functionality for all menu classes to eliminate duplication.
 """
 
-from risk_manager_v2.core.config import ConfigStore
-from risk_manager_v2.core.auth import AuthManager
-from risk_manager_v2.core.client import ProjectXClient
+from risk_manager_v2.core.client import get_client
 from risk_manager_v2.core.logger import get_logger
 
 class BaseMenu:
@@ -15,9 +13,10 @@ class BaseMenu:
     def __init__(self):
         """Initialize common components for all menus."""
         self.logger = get_logger(__name__)
-        self.config = ConfigStore()
-        self.auth = AuthManager(self.config)
-        self.client = ProjectXClient(self.config, self.auth)
+        # All menus share one client (and its config, auth session and rate limiter)
+        self.client = get_client()
+        self.config = self.client.config
+        self.auth = self.client.auth
     
     def run(self):
         """Override this method in subclasses."""
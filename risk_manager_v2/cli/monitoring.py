@@ -1,13 +1,8 @@
 ﻿"""
 MonitoringMenu (start/stop/status + dry-run)
 """
-from risk_manager_v2.core.config import ConfigStore
-from risk_manager_v2.core.auth import AuthManager
+from risk_manager_v2.core.client import get_client
 from risk_manager_v2.core.logger import get_logger
-try:
-    from risk_manager_v2.core.clients.projectx import ProjectXClient
-except Exception:
-    from risk_manager_v2.core.client import ProjectXClient  # fallback
 from risk_manager_v2.engine.monitor import RiskMonitor
 try:
     from risk_manager_v2.utils.rate_limiter import TopStepXRateLimiter
@@ -17,9 +12,9 @@ except Exception:
 class MonitoringMenu:
     def __init__(self):
         self.log = get_logger(__name__)
-        self.config = ConfigStore()
-        self.auth = AuthManager(self.config)
-        self.client = ProjectXClient(self.config, self.auth)
+        self.client = get_client()
+        self.config = self.client.config
+        self.auth = self.client.auth
         self.monitor = RiskMonitor()
         self.dry_run = bool(self.config.get("monitor.dry_run", True))
         self.rate_limiter = TopStepXRateLimiter() if TopStepXRateLimiter else None
@@ -6,6 +6,10 @@ Handles canceling orders (single and all).
 
 from .base_menu import BaseMenu
 
+# Order side display names
+_ORDER_SIDE_NAMES = {0: "Buy", 1: "Sell"}
+_get_order_side = _ORDER_SIDE_NAMES.get
+
 class OrdersCancelMenu(BaseMenu):
     """Orders canceling menu."""
     
@@ -120,11 +124,7 @@ class OrdersCancelMenu(BaseMenu):
     
     def get_order_side_display(self, order_side):
         """Convert order side enum to display string."""
-        order_sides = {
-            0: "Buy",
-            1: "Sell"
-        }
-        return order_sides.get(order_side, "Unknown")
+        return _get_order_side(order_side, "Unknown")
 
 if __name__ == "__main__":
     print("Testing OrdersCancelMenu...")
@@ -6,6 +6,12 @@ Handles viewing pending orders.
 
 from .base_menu import BaseMenu
 
+# Display names indexed by the API's contiguous enum values
+_ORDER_TYPE_NAMES = ("Unknown", "Limit", "Market", "StopLimit", "Stop", "TrailingStop", "JoinBid", "JoinAsk")
+_ORDER_STATUS_NAMES = ("None", "Open", "Filled", "Cancelled", "Expired", "Rejected", "Pending")
+_ORDER_SIDE_NAMES = {0: "Buy", 1: "Sell"}
+_get_order_side = _ORDER_SIDE_NAMES.get
+
 class OrdersViewMenu(BaseMenu):
     """Orders viewing menu."""
     
@@ -68,38 +74,19 @@ class OrdersViewMenu(BaseMenu):
     
     def get_order_type_display(self, order_type):
         """Convert order type enum to display string."""
-        order_types = {
-            0: "Unknown",
-            1: "Limit",
-            2: "Market",
-            3: "StopLimit",
-            4: "Stop",
-            5: "TrailingStop",
-            6: "JoinBid",
-            7: "JoinAsk"
-        }
-        return order_types.get(order_type, "Unknown")
+        if isinstance(order_type, int) and 0 <= order_type < len(_ORDER_TYPE_NAMES):
+            return _ORDER_TYPE_NAMES[order_type]
+        return "Unknown"
     
     def get_order_side_display(self, order_side):
         """Convert order side enum to display string."""
-        order_sides = {
-            0: "Buy",
-            1: "Sell"
-        }
-        return order_sides.get(order_side, "Unknown")
+        return _get_order_side(order_side, "Unknown")
     
     def get_order_status_display(self, order_status):
         """Convert order status enum to display string."""
-        order_statuses = {
-            0: "None",
-            1: "Open",
-            2: "Filled",
-            3: "Cancelled",
-            4: "Expired",
-            5: "Rejected",
-            6: "Pending"
-        }
-        return order_statuses.get(order_status, "Unknown")
+        if isinstance(order_status, int) and 0 <= order_status < len(_ORDER_STATUS_NAMES):
+            return _ORDER_STATUS_NAMES[order_status]
+        return "Unknown"
 
 if __name__ == "__main__":
     print("Testing OrdersViewMenu...")
@@ -6,6 +6,10 @@ Handles viewing open positions and position details.
 
 from .base_menu import BaseMenu
 
+# Position type display names (API PositionType enum)
+_POSITION_TYPE_NAMES = {0: "Unknown", 1: "Long", 2: "Short"}
+_get_position_type = _POSITION_TYPE_NAMES.get
+
 class PositionsViewMenu(BaseMenu):
     """Positions viewing menu."""
     
@@ -68,12 +72,7 @@ class PositionsViewMenu(BaseMenu):
     
     def get_position_type_display(self, position_type):
         """Convert position type enum to display string."""
-        position_types = {
-            0: "Unknown",
-            1: "Long",
-            2: "Short"
-        }
-        return position_types.get(position_type, "Unknown")
+        return _get_position_type(position_type, "Unknown")
 
 if __name__ == "__main__":
     print("Testing PositionsViewMenu...")
@@ -7,6 +7,10 @@ Handles viewing trade history and P&L calculations.
 from .base_menu import BaseMenu
 from datetime import datetime, timedelta
 
+# Trade side display names
+_TRADE_SIDE_NAMES = {0: "Buy", 1: "Sell"}
+_get_trade_side = _TRADE_SIDE_NAMES.get
+
 class TradesMenu(BaseMenu):
     """Trade history menu."""
     
@@ -269,11 +273,7 @@ class TradesMenu(BaseMenu):
     
     def get_trade_side_display(self, side: int) -> str:
         """Convert trade side enum to display string."""
-        trade_sides = {
-            0: "Buy",
-            1: "Sell"
-        }
-        return trade_sides.get(side, "Unknown")
+        return _get_trade_side(side, "Unknown")
 
 if __name__ == "__main__":
     print("Testing TradesMenu...")
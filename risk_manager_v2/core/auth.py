@@ -5,12 +5,17 @@ Handles TopStepX API authentication and token management.
 """
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import time
 from datetime import datetime, timedelta
 from typing import Dict, Optional, Tuple
 from .config import ConfigStore
 from .logger import get_logger
 
+# How long an is_authenticated() result is reused before re-reading the token
+AUTH_CACHE_TTL = 1.0
+
 class AuthManager:
     """Manages TopStepX API authentication."""
     
@@ -20,9 +25,26 @@ class AuthManager:
         self.session = requests.Session()
         self.session.headers.update({
             'Content-Type': 'application/json',
-            'Accept': 'application/json'
+            'Accept': 'application/json',
+            'Connection': 'keep-alive'
         })
+        
+        # Every call goes to one gateway host: keep few per-host pools but let each
+        # hold enough sockets for the monitor's concurrent fan-out. Retries stay in the client.
+        adapter = HTTPAdapter(
+            pool_connections=self.config.get("api.pool_connections", 4),
+            pool_maxsize=self.config.get("api.pool_maxsize", 64)
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
         self.logger.info(f"Session headers: {dict(self.session.headers)}")
+        
+        # Memoized is_authenticated() result: (monotonic check time, result)
+        self._auth_cache: Optional[Tuple[float, bool]] = None
+    
+    def _invalidate_auth_cache(self) -> None:
+        """Drop the memoized authentication state after token changes."""
+        self._auth_cache = None
     
     def authenticate(self, username: str, api_key: str) -> bool:
         """Authenticate with TopStepX API."""
@@ -66,6 +88,8 @@ class AuthManager:
                         self.config.update_auth(username, api_key)
                         self.config.set("auth.token", token)
                         self.config.set("auth.token_expiry", expiry.isoformat())
+                        self.config.set("auth.token_expiry_epoch", expiry.timestamp())
+                        self._invalidate_auth_cache()
                         
                         # Update session headers
                         self.session.headers.update({
@@ -127,6 +151,8 @@ class AuthManager:
                         # Update expiry (24 hours from now)
                         expiry = datetime.now() + timedelta(hours=24)
                         self.config.set("auth.token_expiry", expiry.isoformat())
+                        self.config.set("auth.token_expiry_epoch", expiry.timestamp())
+                        self._invalidate_auth_cache()
                         self.session.headers.update({
                             'Authorization': f'Bearer {new_token}'
                         })
@@ -145,16 +171,32 @@ class AuthManager:
             return False
     
     def is_authenticated(self) -> bool:
-        """Check if currently authenticated."""
-        token = self.config.get("auth.token")
-        token_expiry = self.config.get("auth.token_expiry")
+        """Check if currently authenticated (result reused for AUTH_CACHE_TTL seconds)."""
+        now = time.monotonic()
+        cached = self._auth_cache
+        if cached is not None and now - cached[0] < AUTH_CACHE_TTL:
+            return cached[1]
         
-        if not token or not token_expiry:
+        result = self._check_authenticated()
+        self._auth_cache = (now, result)
+        return result
+    
+    def _check_authenticated(self) -> bool:
+        """Read and check the stored token and its expiry."""
+        token = self.config.get("auth.token")
+        if not token:
             return False
         
         try:
-            expiry = datetime.fromisoformat(token_expiry)
-            if datetime.now() >= expiry:
+            # Prefer the stored epoch; fall back to parsing the ISO field from older configs
+            expiry_epoch = self.config.get("auth.token_expiry_epoch")
+            if not expiry_epoch:
+                token_expiry = self.config.get("auth.token_expiry")
+                if not token_expiry:
+                    return False
+                expiry_epoch = datetime.fromisoformat(token_expiry).timestamp()
+            
+            if time.time() >= expiry_epoch:
                 self.logger.info("Token expired")
                 return False
             
@@ -190,6 +232,8 @@ class AuthManager:
         """Clear authentication data."""
         self.config.set("auth.token", "")
         self.config.set("auth.token_expiry", "")
+        self.config.set("auth.token_expiry_epoch", 0)
+        self._invalidate_auth_cache()
         self.session.headers.pop('Authorization', None)
         self.logger.info("Logged out")
     
@@ -6,12 +6,19 @@ Handles all API communication with the TopStepX Gateway.
 
 import requests
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional
 from .config import ConfigStore
 from .auth import AuthManager
 from .logger import get_logger
 from risk_manager_v2.utils.rate_limiter import TopStepXRateLimiter
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class ProjectXError(Exception):
     """Custom exception for ProjectX API errors."""
     def __init__(self, message: str, status_code: Optional[int] = None, response_data: Optional[Dict] = None):
@@ -45,7 +52,8 @@ class ProjectXClient:
                 response = session.post(url, json=data, timeout=self.timeout)
                 
                 if response.status_code == 200:
-                    return response.json()
+                    # Parse the raw body in one C-level pass when orjson is available
+                    return orjson.loads(response.content) if orjson is not None else response.json()
                 elif response.status_code == 401:
                     self.logger.warning("401 Unauthorized. Validating token...")
                     if self.auth.validate_token():
@@ -108,6 +116,24 @@ class ProjectXClient:
         data = {"accountId": int(account_id), "contractId": contract_id}
         return self._make_request("POST", "/api/Position/closeContract", data=data)
     
+    def close_positions(self, account_id: str, contract_ids: List[str], max_workers: int = 8) -> List[Optional[Dict]]:
+        """Close several positions concurrently (the API closes one contract per call).
+        
+        Returns one response per contract ID in input order, None where the close failed.
+        """
+        if not contract_ids:
+            return []
+        
+        def close(contract_id: str) -> Optional[Dict]:
+            try:
+                return self.close_position(account_id, contract_id)
+            except ProjectXError as e:
+                self.logger.error(f"Failed to close position {contract_id}: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(contract_ids))) as pool:
+            return list(pool.map(close, contract_ids))
+    
     # Order Management
     def get_open_orders(self, account_id: str) -> List[Dict]:
         """Get pending orders for account."""
@@ -134,6 +160,35 @@ class ProjectXClient:
         data = {"accountId": int(account_id), "orderId": int(order_id)}
         return self._make_request("POST", "/api/Order/cancel", data=data)
     
+    def cancel_orders(self, account_id: str, order_ids: List[str], max_workers: int = 8) -> List[Optional[Dict]]:
+        """Cancel several orders concurrently (the API has no bulk cancel endpoint).
+        
+        Returns one response per order ID in input order, None where the cancel failed.
+        """
+        if not order_ids:
+            return []
+        
+        def cancel(order_id: str) -> Optional[Dict]:
+            try:
+                return self.cancel_order(account_id, order_id)
+            except ProjectXError as e:
+                self.logger.error(f"Failed to cancel order {order_id}: {e}")
+                return None
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(order_ids))) as pool:
+            return list(pool.map(cancel, order_ids))
+    
+    # Trade History
+    def get_trades(self, account_id: str, start_timestamp: str, end_timestamp: Optional[str] = None) -> List[Dict]:
+        """Get trades for account from start_timestamp (ISO 8601) onwards."""
+        data = {"accountId": int(account_id), "startTimestamp": start_timestamp}
+        if end_timestamp is not None:
+            data["endTimestamp"] = end_timestamp
+        response = self._make_request("POST", "/api/Trade/search", data=data)
+        if response and response.get("success"):
+            return response.get("trades", [])
+        return []
+    
     # Market Data
     def get_market_data_bars(self, contract_id: str, start_time: str, end_time: str,
                             unit: int = 2, unit_number: int = 1, live: bool = False,
@@ -159,3 +214,13 @@ class ProjectXClient:
             return len(result) >= 0
         except ProjectXError:
             return False
+
+
+@lru_cache(maxsize=1)
+def get_client() -> ProjectXClient:
+    """Get the process-wide ProjectXClient, building its config and auth on first use.
+    
+    Call get_client.cache_clear() to rebuild it, e.g. after rotating credentials.
+    """
+    config = ConfigStore()
+    return ProjectXClient(config, AuthManager(config))
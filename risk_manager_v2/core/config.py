@@ -6,8 +6,24 @@ Handles loading, saving, and managing application configuration.
 
 import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
+
+# Parsed settings per file, keyed by path: (st_mtime_ns, st_size, config)
+_config_cache: Dict[str, Tuple[int, int, Dict[str, Any]]] = {}
+
+
+def _copy_tree(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy nested config dicts so instances never share mutable sections."""
+    return {k: _copy_tree(v) if isinstance(v, dict) else v for k, v in data.items()}
+
+
+@lru_cache(maxsize=8)
+def _ensure_dir(path: str) -> None:
+    """Create a directory once per process; later calls are a cache hit."""
+    Path(path).mkdir(parents=True, exist_ok=True)
+
 
 class ConfigStore:
     """Manages application configuration and settings."""
@@ -20,14 +36,25 @@ class ConfigStore:
     
     def load_config(self) -> None:
         """Load configuration from file or create default."""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r') as f:
-                    self.config = json.load(f)
-            except (json.JSONDecodeError, IOError) as e:
-                print(f"Error loading config: {e}")
-                self.create_default_config()
-        else:
+        path = str(self.config_file)
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            self.create_default_config()
+            return
+        
+        # Unchanged file: reuse the last parse instead of re-reading it
+        cached = _config_cache.get(path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            self.config = _copy_tree(cached[2])
+            return
+        
+        try:
+            with open(self.config_file, 'r') as f:
+                self.config = json.load(f)
+            _config_cache[path] = (st.st_mtime_ns, st.st_size, _copy_tree(self.config))
+        except (json.JSONDecodeError, IOError) as e:
+            print(f"Error loading config: {e}")
             self.create_default_config()
     
     def create_default_config(self) -> None:
@@ -38,13 +65,16 @@ class ConfigStore:
                 "user_hub": "https://gateway-rtc-demo.s2f.projectx.com/hubs/user",
                 "market_hub": "https://gateway-rtc-demo.s2f.projectx.com/hubs/market",
                 "timeout": 30,
-                "max_retries": 3
+                "max_retries": 3,
+                "pool_connections": 4,
+                "pool_maxsize": 64
             },
             "auth": {
                 "userName": "",  # Changed to match API field name
                 "api_key": "",
                 "token": "",
-                "token_expiry": ""
+                "token_expiry": "",
+                "token_expiry_epoch": 0
             },
             "logging": {
                 "level": "INFO",
@@ -66,6 +96,9 @@ class ConfigStore:
                 "end_of_day_flatten": True,
                 "session_timeout": 30
             },
+            "monitoring": {
+                "poll_interval": 30
+            },
             "trading_hours": {
                 "start": "09:30",
                 "end": "16:00",
@@ -87,10 +120,13 @@ class ConfigStore:
         """Save configuration to file."""
         try:
             # Ensure config directory exists
-            self.config_file.parent.mkdir(parents=True, exist_ok=True)
+            _ensure_dir(str(self.config_file.parent))
             
             with open(self.config_file, 'w') as f:
                 json.dump(self.config, f, indent=2)
+            
+            st = os.stat(self.config_file)
+            _config_cache[str(self.config_file)] = (st.st_mtime_ns, st.st_size, _copy_tree(self.config))
         except IOError as e:
             print(f"Error saving config: {e}")
     
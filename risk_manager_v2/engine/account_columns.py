@@ -0,0 +1,97 @@
+﻿"""
+Account Columns
+
+Per-account numeric monitoring state as columns, one slot per account.
+"""
+
+from array import array
+from typing import Any, Dict, List
+
+class AccountColumns:
+    """Daily P&L, trade and violation counts per monitored account, stored column-wise for cheap totals."""
+    
+    def __init__(self):
+        # Slot per account; each check writes only its own account's slot
+        self._slots = {}
+        self._accounts = []
+        self._pnl = array('d')
+        self._trades = array('q')
+        self._violations = array('q')
+    
+    def track(self, account_id) -> None:
+        """Give an account a slot, or zero the one it already has."""
+        slot = self._slots.get(account_id)
+        if slot is None:
+            self._slots[account_id] = len(self._pnl)
+            self._accounts.append(account_id)
+            self._pnl.append(0.0)
+            self._trades.append(0)
+            self._violations.append(0)
+        else:
+            self._pnl[slot] = 0.0
+            self._trades[slot] = 0
+            self._violations[slot] = 0
+    
+    def record_check(self, account_id, daily_pnl: float, daily_trades: int) -> None:
+        """Store the P&L and trade count from an account's latest check."""
+        slot = self._slots[account_id]
+        self._pnl[slot] = daily_pnl
+        self._trades[slot] = daily_trades
+    
+    def set_violations(self, account_id, count: int) -> None:
+        """Store an account's violation history length."""
+        self._violations[self._slots[account_id]] = count
+    
+    def totals(self) -> Dict[str, Any]:
+        """Aggregate P&L, trade and violation totals across all slots."""
+        violations = self._violations
+        return {
+            'total_daily_pnl': sum(self._pnl, 0.0),
+            'total_daily_trades': sum(self._trades),
+            'total_violations': sum(violations),
+            'accounts_with_violations': len(violations) - violations.count(0)
+        }
+    
+    def daily_limit_breaches(self, daily_limits) -> List[Any]:
+        """Account IDs whose last check breached a daily limit, in one sweep over the columns."""
+        if not daily_limits or not daily_limits.is_enabled():
+            return []
+        
+        max_loss = daily_limits.max_daily_loss
+        profit_target = daily_limits.daily_profit_target
+        max_trades = daily_limits.max_daily_trades
+        
+        # Same predicates as RiskCalculator.check_violations
+        return [account_id
+                for account_id, pnl, trades in zip(self._accounts, self._pnl, self._trades)
+                if pnl < -max_loss or pnl > profit_target or trades >= max_trades]
+    
+    def clear(self) -> None:
+        """Drop every slot."""
+        self._slots.clear()
+        del self._accounts[:]
+        del self._pnl[:], self._trades[:], self._violations[:]
+    
+    def clear_violations(self) -> None:
+        """Zero every account's violation count."""
+        violations = self._violations
+        for slot in range(len(violations)):
+            violations[slot] = 0
+
+if __name__ == "__main__":
+    print("Testing AccountColumns...")
+    
+    from risk_manager_v2.models.rules_daily import DailyLimits
+    
+    columns = AccountColumns()
+    columns.track('acc_1')
+    columns.track('acc_2')
+    columns.record_check('acc_1', -1500.0, 3)
+    columns.record_check('acc_2', 250.0, 2)
+    columns.set_violations('acc_1', 1)
+    print("âœ… AccountColumns created successfully!")
+    
+    print(f"âœ… Totals: {columns.totals()}")
+    print(f"âœ… Daily limit breaches: {columns.daily_limit_breaches(DailyLimits())}")
+    
+    print("âœ… AccountColumns test completed!")
@@ -7,6 +7,7 @@ Calculates risk metrics and checks for rule violations.
 from datetime import datetime, date
 from typing import Dict, List, Optional
 from risk_manager_v2.core.logger import get_logger
+from risk_manager_v2.engine.snapshot import PositionBatch
 
 class RiskCalculator:
     """Calculates risk metrics and detects violations."""
@@ -15,12 +16,14 @@ class RiskCalculator:
         self.logger = get_logger(__name__)
     
     def calculate_risk_metrics(self, account_data: Dict, positions: List[Dict], 
-                             trades: List[Dict], risk_rules) -> Dict:
-        """Calculate comprehensive risk metrics for an account."""
+                             trades: List[Dict], risk_rules,
+                             daily_pnl: Optional[float] = None,
+                             now: Optional[datetime] = None) -> Dict:
+        """Calculate comprehensive risk metrics (daily_pnl: precomputed running total, if any)."""
         try:
             metrics = {
                 'account_id': account_data.get('id'),  # TopStepX API uses 'id'
-                'timestamp': datetime.now(),
+                'timestamp': now or datetime.now(),
                 'daily_pnl': 0.0,
                 'daily_trades': 0,
                 'total_positions': len(positions),
@@ -30,8 +33,10 @@ class RiskCalculator:
                 'largest_position': None
             }
             
-            # Calculate daily P&L from trades
-            metrics['daily_pnl'] = self._calculate_daily_pnl(trades)
+            # Calculate daily P&L from trades unless the caller keeps a running total
+            if daily_pnl is None:
+                daily_pnl = self._calculate_daily_pnl(trades)
+            metrics['daily_pnl'] = daily_pnl
             
             # Count daily trades
             metrics['daily_trades'] = len(trades)
@@ -171,32 +176,26 @@ class RiskCalculator:
     
     def _calculate_position_metrics(self, positions: List[Dict]) -> Dict:
         """Calculate position-related metrics using TopStepX API structure."""
-        total_exposure = 0.0
+        # Column view of the rows (built once per check by MonitorCore when available)
+        batch = PositionBatch.from_positions(positions)
+        
+        # Track largest position (first one wins on ties; none if every size is 0)
         max_position_size = 0
         largest_position = None
-        
-        for position in positions:
-            # TopStepX API position structure: accountId, contractId, size, avgPrice
-            size = abs(float(position.get('size', 0)))
-            avg_price = float(position.get('avgPrice', 0))
-            contract_id = position.get('contractId', 'Unknown')
-            
-            # Calculate position value
-            position_value = size * avg_price
-            total_exposure += position_value
-            
-            # Track largest position
-            if size > max_position_size:
-                max_position_size = size
-                largest_position = {
-                    'contract_id': contract_id,
-                    'size': size,
-                    'avg_price': avg_price,
-                    'value': position_value
-                }
+        index = batch.largest_index()
+        if index is not None:
+            size = batch.sizes[index]
+            avg_price = batch.avg_prices[index]
+            max_position_size = size
+            largest_position = {
+                'contract_id': batch.contract_ids[index] or 'Unknown',
+                'size': size,
+                'avg_price': avg_price,
+                'value': size * avg_price
+            }
         
         return {
-            'total_exposure': total_exposure,
+            'total_exposure': batch.total_exposure(),
             'max_position_size': max_position_size,
             'largest_position': largest_position
         }
@@ -0,0 +1,102 @@
+﻿"""
+Enforcement Snapshot
+
+Runs a tick's enforcement against one snapshot of an account's positions and orders.
+"""
+
+from typing import Any, Dict, List, Optional, Tuple
+from risk_manager_v2.core.logger import get_logger
+from risk_manager_v2.engine.snapshot import PositionBatch
+
+logger = get_logger(__name__)
+
+# Violations whose handler closes every open position / cancels every pending order
+CLOSES_ALL_POSITIONS = frozenset(('DAILY_LOSS_LIMIT', 'DAILY_PROFIT_TARGET', 'OUTSIDE_TRADING_HOURS'))
+CANCELS_ALL_ORDERS = frozenset(('DAILY_LOSS_LIMIT', 'OUTSIDE_TRADING_HOURS'))
+
+# Violations whose handler reads the open orders
+USES_ORDERS = CANCELS_ALL_ORDERS | {'DAILY_TRADE_LIMIT'}
+
+def enforce_violations(enforcer, account_id: str, violations: List[Dict], metrics: Dict,
+                       positions: Optional[PositionBatch] = None) -> List[Tuple[Dict, Optional[str]]]:
+    """
+    Run each violation's enforcement handler, sharing one positions/orders snapshot.
+    
+    Close-all handlers run first; once one has run, later handlers see an empty
+    snapshot instead of re-closing the same positions or re-cancelling the same orders.
+    Orders are fetched only when a handler needs them. If that fetch fails, the handler
+    gets None and fetches for itself, so a failed lookup never blocks a flatten.
+    
+    Args:
+        enforcer: RiskEnforcer executing the actions
+        account_id: Account the violations belong to
+        violations: Violations detected in this tick
+        metrics: Risk metrics the violations were detected from
+        positions: Positions fetched for this tick, or None to let handlers fetch
+    
+    Returns:
+        (violation, action taken or None) per violation, in execution order
+    """
+    orders = None
+    orders_known = False
+    results = []
+    for violation in sorted(violations, key=lambda v: v.get('type') not in CLOSES_ALL_POSITIONS):
+        violation_type = violation.get('type')
+        if violation_type in USES_ORDERS and not orders_known:
+            orders_known = True
+            try:
+                orders = enforcer.client.get_open_orders(account_id)
+            except Exception as e:
+                logger.warning(f"Open orders lookup failed for account {account_id}, handlers will refetch: {e}")
+        
+        results.append((violation, enforcer.execute_action(account_id, violation, metrics, positions, orders)))
+        
+        if violation_type in CLOSES_ALL_POSITIONS:
+            positions = PositionBatch()
+        if violation_type in CANCELS_ALL_ORDERS:
+            orders = []
+            orders_known = True
+    return results
+
+def get_enforcement_summary(client, account_id: str) -> Dict[str, Any]:
+    """Get enforcement action summary for an account."""
+    try:
+        # Get current positions and orders
+        positions = client.get_positions(account_id) or []
+        orders = client.get_open_orders(account_id) or []
+        
+        return {
+            'account_id': account_id,
+            'open_positions': len(positions),
+            'pending_orders': len([o for o in orders if o.get('status') == 1]),
+            'total_exposure': sum(abs(float(p.get('size', 0)) * float(p.get('avgPrice', 0)) for p in positions)),
+            'can_enforce': len(positions) > 0 or len(orders) > 0
+        }
+        
+    except Exception as e:
+        logger.error(f"Error getting enforcement summary: {e}")
+        return {
+            'account_id': account_id,
+            'open_positions': 0,
+            'pending_orders': 0,
+            'total_exposure': 0.0,
+            'can_enforce': False,
+            'error': str(e)
+        }
+
+if __name__ == "__main__":
+    print("Testing enforcement snapshot...")
+    
+    class _StubEnforcer:
+        """Records the snapshot each handler is given."""
+        client = None
+        
+        def execute_action(self, account_id, violation, metrics, positions, orders):
+            return f"{violation['type']}: {len(positions)} positions"
+    
+    positions = PositionBatch.from_positions([{'contractId': 'CON.F.US.EP.H25', 'size': 2, 'avgPrice': 2100.0}])
+    results = enforce_violations(_StubEnforcer(), "123",
+                                 [{'type': 'POSITION_SIZE_LIMIT'}, {'type': 'DAILY_PROFIT_TARGET'}], {}, positions)
+    print(f"âœ… Actions: {[action for _, action in results]}")
+    
+    print("âœ… Enforcement snapshot test completed!")
@@ -5,10 +5,14 @@ Main coordinator for the auto-enforcement system.
 """
 
 import threading
-import time
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, wait
+from types import MappingProxyType
 from typing import Dict, List, Optional
 from risk_manager_v2.core.logger import get_logger
+from risk_manager_v2.engine.schemas import ActionPlan, EvaluationContext
+from risk_manager_v2.utils.clock import now_iso
+
+__all__ = ["RiskMonitor"]
 
 class RiskMonitor:
     """Main risk monitoring coordinator."""
@@ -19,24 +23,28 @@ class RiskMonitor:
         # Monitoring state
         self.monitoring_thread = None
         self.stop_event = threading.Event()
-        self.is_running = False
+        self._running = False
         
         # Counters
         self.total_evaluations = 0
         self.total_actions = 0
+        self.noop_evaluations = 0  # evaluations with nothing to enforce (not logged)
+        # Copy-on-write: writers rebind a new dict under the lock, readers take the reference
         self.violations_current = {}  # per account
+        self._counter_lock = threading.Lock()
+        self._violations_lock = threading.Lock()
         
         # Components (stubs for now)
         self.client = None
         self.rate_limiter = None
         self.dry_run = True
         
-        # Monitored accounts (stub)
-        self.monitored_accounts = []
+        # Monitored accounts (stub); an immutable tuple that is replaced, never mutated
+        self.monitored_accounts = ()
     
     def start_monitoring(self, client, rate_limiter=None, dry_run=True) -> bool:
         """Start monitoring with background thread."""
-        if self.is_running:
+        if self._running:
             self.logger.warning("Monitoring already running")
             return False
         
@@ -46,7 +54,7 @@ class RiskMonitor:
         self.stop_event.clear()
         
         # Get monitored accounts (stub)
-        self.monitored_accounts = self._get_monitored_accounts()
+        self.monitored_accounts = tuple(self._get_monitored_accounts())
         
         # Start monitoring thread
         self.monitoring_thread = threading.Thread(
@@ -54,14 +62,14 @@ class RiskMonitor:
             daemon=True
         )
         self.monitoring_thread.start()
-        self.is_running = True
+        self._running = True
         
         self.logger.info(f"Started monitoring {len(self.monitored_accounts)} accounts (dry_run={dry_run})")
         return True
     
     def stop_monitoring(self) -> bool:
         """Stop monitoring cleanly."""
-        if not self.is_running:
+        if not self._running:
             return True
         
         self.logger.info("Stopping monitoring...")
@@ -70,29 +78,37 @@ class RiskMonitor:
         if self.monitoring_thread and self.monitoring_thread.is_alive():
             self.monitoring_thread.join(timeout=5.0)
         
-        self.is_running = False
+        self._running = False
         self.logger.info("Monitoring stopped")
         return True
     
     def _monitoring_loop(self):
-        """Main monitoring loop with pacing."""
-        while not self.stop_event.is_set():
-            try:
-                # Check each monitored account
-                for account_id in self.monitored_accounts:
-                    if self.stop_event.is_set():
-                        break
-                    
-                    self._evaluate_account(account_id)
-                
-                # Wait for next cycle (0.5-1.0 seconds)
-                if not self.stop_event.wait(0.75):
-                    continue
+        """Main monitoring loop with pacing; accounts are evaluated concurrently."""
+        max_workers = min(32, max(1, len(self.monitored_accounts)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="risk-eval") as pool:
+            while not self.stop_event.is_set():
+                try:
+                    # Evaluate every account in parallel so a slow one cannot stall the cycle
+                    futures = [
+                        pool.submit(self._evaluate_account_staggered, account_id, index)
+                        for index, account_id in enumerate(self.monitored_accounts)
+                    ]
+                    wait(futures)
                     
-            except Exception as e:
-                self.logger.error(f"Error in monitoring loop: {e}")
-                if not self.stop_event.wait(1.0):
-                    continue
+                    # Wait for next cycle (0.5-1.0 seconds)
+                    if not self.stop_event.wait(0.75):
+                        continue
+                        
+                except Exception as e:
+                    self.logger.error(f"Error in monitoring loop: {e}")
+                    if not self.stop_event.wait(1.0):
+                        continue
+    
+    def _evaluate_account_staggered(self, account_id: str, index: int):
+        """Evaluate an account after a small per-account offset to spread API load."""
+        if index and self.stop_event.wait(index * 0.01):
+            return
+        self._evaluate_account(account_id)
     
     def _evaluate_account(self, account_id: str):
         """Evaluate a single account for risk violations."""
@@ -108,49 +124,53 @@ class RiskMonitor:
             action_plan = self._evaluate_risk_engine(evaluation_context)
             
             # Update counters
-            self.total_evaluations += 1
+            with self._counter_lock:
+                self.total_evaluations += 1
             
-            # Apply enforcement if needed
-            if action_plan and action_plan.get('actions'):
+            # Apply enforcement if needed; the common no-op case only bumps a counter
+            if action_plan and action_plan.actions:
                 self._apply_enforcement(account_id, action_plan)
+            else:
+                with self._counter_lock:
+                    self.noop_evaluations += 1
             
         except Exception as e:
             self.logger.error(f"Error evaluating account {account_id}: {e}")
     
-    def _build_evaluation_context(self, account_id: str) -> Dict:
+    def _build_evaluation_context(self, account_id: str) -> EvaluationContext:
         """Build minimal evaluation context."""
-        return {
-            'account_id': account_id,
-            'timestamp': datetime.now().isoformat(),
-            'dry_run': self.dry_run
-        }
+        return EvaluationContext(
+            account_id=account_id,
+            timestamp=now_iso(),
+            dry_run=self.dry_run
+        )
     
-    def _evaluate_risk_engine(self, context: Dict) -> Optional[Dict]:
+    def _evaluate_risk_engine(self, context: EvaluationContext) -> Optional[ActionPlan]:
         """Evaluate risk engine (stub)."""
         # Stub implementation - return empty action plan
-        return {
-            'account_id': context['account_id'],
-            'actions': [],
-            'violations': []
-        }
+        return ActionPlan(account_id=context.account_id)
     
-    def _apply_enforcement(self, account_id: str, action_plan: Dict):
+    def _apply_enforcement(self, account_id: str, action_plan: ActionPlan):
         """Apply enforcement actions."""
         try:
             # Stub enforcement - just count actions
-            actions = action_plan.get('actions', [])
-            violations = action_plan.get('violations', [])
+            actions = action_plan.actions
+            violations = action_plan.violations
             
             if actions and not self.dry_run:
                 # Would call Enforcer.apply(account_id, action_plan)
-                self.total_actions += len(actions)
+                with self._counter_lock:
+                    self.total_actions += len(actions)
                 self.logger.info(f"Applied {len(actions)} actions for account {account_id}")
             
-            # Update violation counters
-            if violations:
-                self.violations_current[account_id] = len(violations)
-            else:
-                self.violations_current[account_id] = 0
+            # Update violation counters (copy only when the count changes)
+            count = len(violations)
+            with self._violations_lock:
+                current = self.violations_current
+                if current.get(account_id) != count:
+                    updated = dict(current)
+                    updated[account_id] = count
+                    self.violations_current = updated
                 
         except Exception as e:
             self.logger.error(f"Error applying enforcement for {account_id}: {e}")
@@ -163,20 +183,21 @@ class RiskMonitor:
     def get_monitoring_status(self) -> Dict:
         """Get current monitoring status."""
         return {
-            'status': 'running' if self.is_running else 'stopped',
-            'monitored_accounts': self.monitored_accounts.copy(),
+            'status': 'running' if self._running else 'stopped',
+            'monitored_accounts': self.monitored_accounts,
             'metrics': {
                 'total_evaluations': self.total_evaluations,
                 'total_actions': self.total_actions,
-                'violations_current': self.violations_current.copy()
+                'noop_evaluations': self.noop_evaluations,
+                'violations_current': MappingProxyType(self.violations_current)
             },
             'dry_run': self.dry_run,
-            'last_update': datetime.now().isoformat()
+            'last_update': now_iso()
         }
     
     def is_running(self) -> bool:
         """Check if monitoring is active."""
-        return self.is_running
+        return self._running
 
 if __name__ == "__main__":
     print("Testing RiskMonitor router...")
@@ -4,42 +4,99 @@ Monitor Core Logic
 Core monitoring functionality and state management.
 """
 
-from risk_manager_v2.core.config import ConfigStore
-from risk_manager_v2.core.auth import AuthManager
-from risk_manager_v2.core.client import ProjectXClient
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from types import MappingProxyType
+
+from risk_manager_v2.core.client import get_client
 from risk_manager_v2.core.logger import get_logger
 from risk_manager_v2.models.rules import RiskRules
-from engine.calculator import RiskCalculator
-from engine.enforcer import RiskEnforcer
+from risk_manager_v2.engine.account_columns import AccountColumns
+from risk_manager_v2.engine.calculator import RiskCalculator
+from risk_manager_v2.engine.enforcer import RiskEnforcer
+from risk_manager_v2.engine.enforcement_snapshot import enforce_violations
+from risk_manager_v2.engine.snapshot import PositionBatch
+from risk_manager_v2.engine.trade_feed import TodaysTrades
+
+# Violation history bounds: per account, and for the cross-account log
+ACCOUNT_VIOLATION_LIMIT = 1000
+VIOLATION_LOG_LIMIT = 10000
 
 class MonitorCore:
     """Core monitoring logic and state management."""
     
     def __init__(self):
         self.logger = get_logger(__name__)
-        self.config = ConfigStore()
-        self.auth = AuthManager(self.config)
-        self.client = ProjectXClient(self.config, self.auth)
+        self.client = get_client()
+        self.config = self.client.config
+        self.auth = self.client.auth
         
         # Core components
         self.calculator = RiskCalculator()
         self.enforcer = RiskEnforcer(self.client)
         
+        # Shared pool for the per-account API fan-out
+        self._fetch_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="monitor-fetch")
+        
         # Monitoring state
         self.monitored_accounts = {}
+        
+        # Monitored account IDs, rebuilt only when membership changes
+        self.account_ids = ()
+        
+        # Violations across all accounts, oldest first
+        self.violation_log = deque(maxlen=VIOLATION_LOG_LIMIT)
+        
+        # Numeric per-account state as columns (slot per account) for cheap totals
+        self.columns = AccountColumns()
+        
+        # Account rows from the latest /api/Account/search, keyed by account id
+        self._account_snapshot = {}
+        
+        # Serializes the refresh a snapshot miss triggers; set once one has run since the last full refresh
+        self._refresh_lock = threading.Lock()
+        self._miss_refreshed = False
+        
+        # Per-account trades for the current UTC day, fetched incrementally
+        self.todays_trades = TodaysTrades(self.client)
         self.risk_rules = None
         
+        # Settings file mtime the current risk_rules were built from
+        self._rules_mtime = None
+        
         self.load_risk_rules()
     
     def load_risk_rules(self):
         """Load risk rules from configuration."""
         try:
-            self.risk_rules = RiskRules()
+            # The 'risk' settings section carries both daily and position limit fields
+            risk_config = self.config.get("risk", {})
+            self.risk_rules = RiskRules.from_dict({
+                "daily_limits": risk_config,
+                "position_limits": risk_config
+            })
             self.logger.info("Risk rules loaded successfully")
         except Exception as e:
             self.logger.error(f"Failed to load risk rules: {e}")
             self.risk_rules = None
     
+    def refresh_risk_rules(self):
+        """Rebuild risk rules only when the settings file has changed on disk."""
+        try:
+            mtime = os.stat(self.config.config_file).st_mtime_ns
+        except OSError:
+            return
+        
+        if mtime == self._rules_mtime:
+            return
+        
+        self.config.load_config()
+        self.load_risk_rules()
+        self._rules_mtime = mtime
+    
     def initialize_accounts(self, account_ids):
         """Initialize monitoring state for accounts."""
         for account_id in account_ids:
@@ -47,75 +104,107 @@ class MonitorCore:
                 'last_check': None,
                 'daily_pnl': 0.0,
                 'daily_trades': 0,
-                'violations': []
+                'violations': deque(maxlen=ACCOUNT_VIOLATION_LIMIT)
             }
+            self.columns.track(account_id)
         
+        self.account_ids = tuple(self.monitored_accounts)
         self.logger.info(f"Initialized monitoring for {len(account_ids)} accounts")
     
+    def refresh_accounts(self):
+        """Fetch all accounts in one request and index them by id for this cycle."""
+        try:
+            accounts = self.client.get_accounts()
+        except Exception as e:
+            self.logger.error(f"Failed to refresh accounts: {e}")
+            return self._account_snapshot
+        
+        self._account_snapshot = {str(acc.get('id')): acc for acc in accounts}
+        self._miss_refreshed = False
+        return self._account_snapshot
+    
+    def _refresh_on_miss(self):
+        """Refresh the account snapshot for a missing account, at most once per cycle across workers."""
+        with self._refresh_lock:
+            if not self._miss_refreshed:
+                self.refresh_accounts()
+                self._miss_refreshed = True
+            return self._account_snapshot
+    
     def check_account(self, account_id):
         """Check a single account for risk violations."""
         try:
-            # Get current account data
-            account_data = self.client.get_account(account_id)
+            # Account rows come from the per-cycle batch; fetch one only if missing
+            key = str(account_id)
+            account_data = self._account_snapshot.get(key)
             if not account_data:
-                return
+                account_data = self._refresh_on_miss().get(key)
+                if not account_data:
+                    return
             
-            # Get current positions and trades
-            positions = self.client.get_positions(account_id)
-            trades = self._get_todays_trades(account_id)
+            # Fetch positions and trades concurrently (one RTT of wall time)
+            submit = self._fetch_pool.submit
+            positions_future = submit(self.client.get_open_positions, account_id)
+            trades_future = submit(self.todays_trades.fetch, account_id)
+            positions = PositionBatch.from_positions(positions_future.result())
+            trades, daily_pnl = trades_future.result()
+            
+            # One clock read stamps the metrics, state and violation log for this check
+            now = datetime.now()
             
             # Calculate risk metrics
             risk_metrics = self.calculator.calculate_risk_metrics(
-                account_data, positions, trades, self.risk_rules
+                account_data, positions, trades, self.risk_rules, daily_pnl, now=now
             )
             
             # Check for violations
             violations = self.calculator.check_violations(risk_metrics, self.risk_rules)
             
             # Update state
-            self._update_account_state(account_id, risk_metrics, violations)
+            self._update_account_state(account_id, risk_metrics, violations, now)
             
             # Handle violations
             if violations:
-                self._handle_violations(account_id, violations, risk_metrics)
+                self._handle_violations(account_id, violations, risk_metrics, positions, now)
             
         except Exception as e:
             self.logger.error(f"Error checking account {account_id}: {e}")
     
-    def _get_todays_trades(self, account_id):
-        """Get today's trades for account."""
-        from datetime import datetime
-        today = datetime.now().date()
-        return self.client.get_trades(account_id, start_date=today)
-    
-    def _update_account_state(self, account_id, metrics, violations):
+    def _update_account_state(self, account_id, metrics, violations, now=None):
         """Update account monitoring state."""
-        from datetime import datetime
+        daily_pnl = metrics.get('daily_pnl', 0.0)
+        daily_trades = metrics.get('daily_trades', 0)
         
-        self.monitored_accounts[account_id].update({
-            'last_check': datetime.now(),
-            'daily_pnl': metrics.get('daily_pnl', 0.0),
-            'daily_trades': metrics.get('daily_trades', 0),
+        # Replace the entry in one assignment so concurrent status readers never see a partial update
+        self.monitored_accounts[account_id] = {
+            **self.monitored_accounts[account_id],
+            'last_check': now or datetime.now(),
+            'daily_pnl': daily_pnl,
+            'daily_trades': daily_trades,
             'current_violations': violations
-        })
+        }
+        self.columns.record_check(account_id, daily_pnl, daily_trades)
     
-    def _handle_violations(self, account_id, violations, metrics):
+    def _handle_violations(self, account_id, violations, metrics, positions=None, now=None):
         """Handle detected risk violations."""
         self.logger.warning(f"Risk violations detected for account {account_id}: {violations}")
         
         # Log violations
-        from datetime import datetime
+        timestamp = now or datetime.now()
+        account_violations = self.monitored_accounts[account_id]['violations']
         for violation in violations:
-            self.monitored_accounts[account_id]['violations'].append({
-                'timestamp': datetime.now(),
+            entry = {
+                'account_id': account_id,
+                'timestamp': timestamp,
                 'violation': violation,
                 'metrics': metrics
-            })
+            }
+            account_violations.append(entry)
+            self.violation_log.append(entry)
+        self.columns.set_violations(account_id, len(account_violations))
         
-        # Execute enforcement
-        for violation in violations:
-            action_taken = self.enforcer.execute_action(account_id, violation, metrics)
-            
+        # Execute enforcement against one snapshot of positions/orders for the tick
+        for violation, action_taken in enforce_violations(self.enforcer, account_id, violations, metrics, positions):
             if action_taken:
                 self.logger.info(f"Enforcement action executed: {action_taken}")
             else:
@@ -131,17 +220,37 @@ class MonitorCore:
         return self.monitored_accounts.get(account_id, {})
     
     def get_all_accounts_status(self):
-        """Get status for all monitored accounts."""
-        return self.monitored_accounts.copy()
+        """Get a read-only live view of status for all monitored accounts."""
+        return MappingProxyType(self.monitored_accounts)
+    
+    def get_account_totals(self):
+        """Get aggregate P&L, trade and violation totals across monitored accounts."""
+        return self.columns.totals()
+    
+    def get_daily_limit_breaches(self):
+        """Get monitored account IDs whose last check breached a daily limit."""
+        return self.columns.daily_limit_breaches(self.risk_rules.daily_limits if self.risk_rules else None)
+    
+    def clear_accounts(self):
+        """Stop tracking all accounts and reset their aggregate columns."""
+        self.monitored_accounts.clear()
+        self.account_ids = ()
+        self.columns.clear()
     
     def clear_violations(self, account_id=None):
         """Clear violation history for account(s)."""
         if account_id:
             if account_id in self.monitored_accounts:
-                self.monitored_accounts[account_id]['violations'] = []
+                self.monitored_accounts[account_id]['violations'].clear()
+                self.columns.set_violations(account_id, 0)
+                kept = [entry for entry in self.violation_log if entry['account_id'] != account_id]
+                self.violation_log.clear()
+                self.violation_log.extend(kept)
         else:
             for account_data in self.monitored_accounts.values():
-                account_data['violations'] = []
+                account_data['violations'].clear()
+            self.violation_log.clear()
+            self.columns.clear_violations()
 
 if __name__ == "__main__":
     print("Testing MonitorCore...")
@@ -157,6 +266,7 @@ if __name__ == "__main__":
     # Test account initialization
     core.initialize_accounts(['test_account_1', 'test_account_2'])
     print(f"âœ… Accounts initialized: {len(core.monitored_accounts)}")
+    print(f"âœ… Daily limit breaches: {core.get_daily_limit_breaches()}")
     
     print("âœ… MonitorCore test completed!")
 
@@ -4,8 +4,8 @@ Monitor Loop
 Handles the continuous monitoring loop and thread management.
 """
 
-import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from risk_manager_v2.core.logger import get_logger
 
 class MonitorLoop:
@@ -14,7 +14,9 @@ class MonitorLoop:
     def __init__(self, core):
         self.logger = get_logger(__name__)
         self.core = core
-        self.is_running = False
+        # Set while stopped; the loop runs until it is set again
+        self._stop_event = threading.Event()
+        self._stop_event.set()
         self.monitoring_thread = None
     
     def start(self, account_ids=None):
@@ -25,8 +27,7 @@ class MonitorLoop:
         
         # Get accounts to monitor
         if account_ids is None:
-            accounts = self.core.client.get_accounts()
-            account_ids = [acc['accountId'] for acc in accounts]
+            account_ids = list(self.core.refresh_accounts())
         
         if not account_ids:
             self.logger.error("No accounts to monitor")
@@ -36,7 +37,7 @@ class MonitorLoop:
         self.core.initialize_accounts(account_ids)
         
         # Start monitoring thread
-        self.is_running = True
+        self._stop_event.clear()
         self.monitoring_thread = threading.Thread(target=self._monitoring_loop)
         self.monitoring_thread.daemon = True
         self.monitoring_thread.start()
@@ -47,41 +48,48 @@ class MonitorLoop:
     def stop(self):
         """Stop the monitoring loop."""
         self.logger.info("Stopping monitoring loop")
-        self.is_running = False
+        self._stop_event.set()
         
         if self.monitoring_thread:
             self.monitoring_thread.join(timeout=5)
         
-        self.core.monitored_accounts.clear()
+        self.core.clear_accounts()
         self.logger.info("Monitoring loop stopped")
     
     def _monitoring_loop(self):
         """Main monitoring loop - runs continuously."""
         self.logger.info("Monitoring loop started")
         
-        while self.is_running:
-            try:
-                # Check each monitored account
-                for account_id in list(self.core.monitored_accounts.keys()):
-                    self.core.check_account(account_id)
-                
-                # Wait before next check
-                time.sleep(30)  # Check every 30 seconds
-                
-            except Exception as e:
-                self.logger.error(f"Error in monitoring loop: {e}")
-                time.sleep(60)  # Wait longer on error
+        poll_interval = self.core.config.get("monitoring.poll_interval", 30)
+        
+        max_workers = min(32, max(1, len(self.core.monitored_accounts)))
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="monitor-check") as pool:
+            while not self._stop_event.is_set():
+                try:
+                    # Pick up edited rules, run one account search, then check all accounts concurrently
+                    self.core.refresh_risk_rules()
+                    self.core.refresh_accounts()
+                    for _ in pool.map(self.core.check_account, self.core.account_ids):
+                        pass
+                    
+                    # Wait before next check; returns at once when stop() is called
+                    self._stop_event.wait(poll_interval)
+                    
+                except Exception as e:
+                    self.logger.error(f"Error in monitoring loop: {e}")
+                    self._stop_event.wait(60)  # Wait longer on error
         
         self.logger.info("Monitoring loop ended")
     
-    def is_running(self):
+    def is_alive(self):
         """Check if monitoring loop is running."""
-        return self.is_running and self.monitoring_thread and self.monitoring_thread.is_alive()
+        return (not self._stop_event.is_set() and self.monitoring_thread is not None
+                and self.monitoring_thread.is_alive())
     
     def get_loop_status(self):
         """Get current loop status."""
         return {
-            'is_running': self.is_running,
+            'is_running': not self._stop_event.is_set(),
             'thread_alive': self.monitoring_thread.is_alive() if self.monitoring_thread else False,
             'accounts_monitored': len(self.core.monitored_accounts)
         }
@@ -90,7 +98,7 @@ if __name__ == "__main__":
     print("Testing MonitorLoop...")
     
     # Test basic initialization
-    from engine.monitor_core import MonitorCore
+    from risk_manager_v2.engine.monitor_core import MonitorCore
     core = MonitorCore()
     loop = MonitorLoop(core)
     print("âœ… MonitorLoop created successfully!")
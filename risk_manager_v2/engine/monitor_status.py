@@ -4,6 +4,7 @@ Monitor Status
 Handles monitoring status and violation history tracking.
 """
 
+from itertools import islice
 from risk_manager_v2.core.logger import get_logger
 
 class MonitorStatus:
@@ -38,13 +39,10 @@ class MonitorStatus:
     def get_violation_history(self, account_id=None):
         """Get violation history for account(s)."""
         if account_id:
-            return self.core.monitored_accounts.get(account_id, {}).get('violations', [])
+            return list(self.core.monitored_accounts.get(account_id, {}).get('violations', []))
         
-        all_violations = []
-        for account_data in self.core.monitored_accounts.values():
-            all_violations.extend(account_data.get('violations', []))
-        
-        return sorted(all_violations, key=lambda x: x['timestamp'], reverse=True)
+        # The log is appended in time order, so newest-first is just a reversal
+        return list(reversed(self.core.violation_log))
     
     def get_account_summary(self, account_id):
         """Get detailed summary for specific account."""
@@ -60,7 +58,7 @@ class MonitorStatus:
             'daily_trades': data['daily_trades'],
             'current_violations': data.get('current_violations', []),
             'violation_count': len(data['violations']),
-            'recent_violations': data['violations'][-5:]  # Last 5 violations
+            'recent_violations': list(islice(reversed(data['violations']), 5))[::-1]  # Last 5 violations
         }
     
     def get_last_check_time(self):
@@ -84,38 +82,28 @@ class MonitorStatus:
                 'total_violations': 0,
                 'accounts_with_violations': 0,
                 'average_daily_pnl': 0.0,
-                'total_daily_trades': 0
+                'total_daily_trades': 0,
+                'daily_limit_breaches': []
             }
         
-        total_violations = 0
-        accounts_with_violations = 0
-        total_daily_pnl = 0.0
-        total_daily_trades = 0
-        
-        for data in self.core.monitored_accounts.values():
-            violations = len(data['violations'])
-            total_violations += violations
-            if violations > 0:
-                accounts_with_violations += 1
-            
-            total_daily_pnl += data['daily_pnl']
-            total_daily_trades += data['daily_trades']
-        
+        # Column sums maintained by MonitorCore instead of a walk over every account dict
+        totals = self.core.get_account_totals()
         account_count = len(self.core.monitored_accounts)
         
         return {
             'total_accounts': account_count,
-            'total_violations': total_violations,
-            'accounts_with_violations': accounts_with_violations,
-            'average_daily_pnl': total_daily_pnl / account_count if account_count > 0 else 0.0,
-            'total_daily_trades': total_daily_trades
+            'total_violations': totals['total_violations'],
+            'accounts_with_violations': totals['accounts_with_violations'],
+            'average_daily_pnl': totals['total_daily_pnl'] / account_count if account_count > 0 else 0.0,
+            'total_daily_trades': totals['total_daily_trades'],
+            'daily_limit_breaches': self.core.get_daily_limit_breaches()
         }
 
 if __name__ == "__main__":
     print("Testing MonitorStatus...")
     
     # Test basic initialization
-    from engine.monitor_core import MonitorCore
+    from risk_manager_v2.engine.monitor_core import MonitorCore
     core = MonitorCore()
     status = MonitorStatus(core)
     print("âœ… MonitorStatus created successfully!")
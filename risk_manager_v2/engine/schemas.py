@@ -0,0 +1,33 @@
+﻿"""
+Engine Schemas
+
+Fixed-shape payloads passed between the monitor and the risk engine.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Tuple
+
+@dataclass(slots=True, frozen=True)
+class EvaluationContext:
+    """Inputs for evaluating one account on one monitoring cycle."""
+    account_id: str
+    timestamp: str
+    dry_run: bool = True
+
+@dataclass(slots=True, frozen=True)
+class ActionPlan:
+    """Risk engine decision for one account: actions to apply and violations found."""
+    account_id: str
+    actions: Tuple[Dict[str, Any], ...] = field(default_factory=tuple)
+    violations: Tuple[Dict[str, Any], ...] = field(default_factory=tuple)
+
+if __name__ == "__main__":
+    print("Testing engine schemas...")
+
+    context = EvaluationContext(account_id="test_account", timestamp="2025-01-21T16:13:52")
+    print(f"✅ EvaluationContext: {context}")
+
+    plan = ActionPlan(account_id=context.account_id)
+    print(f"✅ ActionPlan: {plan}")
+
+    print("✅ Engine schemas test completed!")
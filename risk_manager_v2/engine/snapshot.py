@@ -0,0 +1,75 @@
+﻿"""
+Position Snapshot
+
+Struct-of-arrays view of the positions fetched for one account check.
+"""
+
+import sys
+from array import array
+from dataclasses import dataclass, field
+from operator import mul
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+@dataclass(slots=True)
+class PositionBatch:
+    """Column-oriented positions snapshot, built once per account check.
+
+    Hot consumers read only the columns they need; iteration, indexing and len()
+    still expose the raw TopStepX rows so list-based callers keep working.
+    """
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    contract_ids: List[Optional[str]] = field(default_factory=list)
+    sizes: array = field(default_factory=lambda: array('d'))
+    avg_prices: array = field(default_factory=lambda: array('d'))
+
+    @classmethod
+    def from_positions(cls, positions: Optional[Iterable[Dict[str, Any]]]) -> 'PositionBatch':
+        """Build the columns from TopStepX position rows (accountId, contractId, size, avgPrice)."""
+        if isinstance(positions, cls):
+            return positions
+
+        rows = list(positions or ())
+        _float = float
+        _intern = sys.intern
+        return cls(
+            rows=rows,
+            # Interned so repeated contract comparisons are identity checks
+            contract_ids=[_intern(c) if isinstance(c, str) else c
+                          for c in (row.get('contractId') for row in rows)],
+            sizes=array('d', [abs(_float(row.get('size', 0))) for row in rows]),
+            avg_prices=array('d', [_float(row.get('avgPrice', 0)) for row in rows])
+        )
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return iter(self.rows)
+
+    def __getitem__(self, index: int) -> Dict[str, Any]:
+        return self.rows[index]
+
+    def total_exposure(self) -> float:
+        """Sum of absolute size times average price across all positions."""
+        return sum(map(mul, self.sizes, self.avg_prices))
+
+    def largest_index(self) -> Optional[int]:
+        """Index of the largest position by size (first on ties), or None if all are flat."""
+        sizes = self.sizes
+        if not sizes:
+            return None
+        index = max(range(len(sizes)), key=sizes.__getitem__)
+        return index if sizes[index] > 0 else None
+
+if __name__ == "__main__":
+    print("Testing PositionBatch...")
+
+    batch = PositionBatch.from_positions([
+        {'accountId': 123, 'contractId': 'CON.F.US.EP.H25', 'size': 2, 'avgPrice': 2100.0},
+        {'accountId': 123, 'contractId': 'CON.F.US.NQ.H25', 'size': -1, 'avgPrice': 15000.0}
+    ])
+    print(f"✅ Positions in batch: {len(batch)}")
+    print(f"✅ Total exposure: {batch.total_exposure()}")
+    print(f"✅ Largest position: {batch.contract_ids[batch.largest_index()]}")
+
+    print("✅ PositionBatch test completed!")
@@ -0,0 +1,77 @@
+﻿"""
+Trade Feed
+
+Incremental per-account fetch of the current UTC day's trades.
+"""
+
+from datetime import datetime, timezone
+from typing import Any, Dict, List, Tuple
+
+class TodaysTrades:
+    """Today's trades and running P&L per account, fetching only trades not seen yet."""
+    
+    def __init__(self, client):
+        self.client = client
+        
+        # Account ID -> today's fetch state (date, since, last_id, unkeyed, trades, daily_pnl)
+        self._cache = {}
+    
+    def fetch(self, account_id) -> Tuple[List[Dict[str, Any]], float]:
+        """Get today's trades and running P&L for account, fetching only new trades."""
+        today = datetime.now(timezone.utc).date()
+        cache = self._cache.get(account_id)
+        if cache is None or cache['date'] != today:
+            # New UTC day (or first check): start from midnight with an empty total
+            cache = {
+                'date': today,
+                'since': f"{today.isoformat()}T00:00:00Z",
+                'last_id': None,
+                # (creationTimestamp, contractId, price, size) of trades without an id;
+                # they never advance 'since', so every later poll returns them again
+                'unkeyed': set(),
+                'trades': [],
+                'daily_pnl': 0.0
+            }
+            self._cache[account_id] = cache
+        
+        # startTimestamp is inclusive, so trades at the boundary are skipped by id
+        last_id = cache['last_id']
+        for trade in self.client.get_trades(account_id, start_timestamp=cache['since']) or []:
+            trade_id = trade.get('id')
+            if trade_id is None:
+                key = (trade.get('creationTimestamp'), trade.get('contractId'), trade.get('price'), trade.get('size'))
+                if key in cache['unkeyed']:
+                    continue
+                cache['unkeyed'].add(key)
+            elif last_id is not None and trade_id <= last_id:
+                continue
+            
+            cache['trades'].append(trade)
+            pnl = trade.get('profitAndLoss')  # None for half-turn trades
+            if pnl is not None:
+                cache['daily_pnl'] += float(pnl)
+            if trade_id is not None and (cache['last_id'] is None or trade_id > cache['last_id']):
+                cache['last_id'] = trade_id
+                cache['since'] = trade.get('creationTimestamp') or cache['since']
+        
+        return cache['trades'], cache['daily_pnl']
+
+if __name__ == "__main__":
+    print("Testing TodaysTrades...")
+    
+    class _StubClient:
+        """Returns the same two trades on every poll, like an inclusive startTimestamp does."""
+        def get_trades(self, account_id, start_timestamp=None):
+            return [
+                {'id': 1, 'creationTimestamp': '2025-01-01T14:00:00Z', 'contractId': 'CON.F.US.EP.H25',
+                 'price': 2100.0, 'size': 1, 'profitAndLoss': 50.0},
+                {'id': None, 'creationTimestamp': '2025-01-01T14:05:00Z', 'contractId': 'CON.F.US.EP.H25',
+                 'price': 2102.0, 'size': 1, 'profitAndLoss': -20.0}
+            ]
+    
+    feed = TodaysTrades(_StubClient())
+    feed.fetch('123')
+    trades, daily_pnl = feed.fetch('123')
+    print(f"âœ… Trades after two polls: {len(trades)}, daily P&L: {daily_pnl}")
+    
+    print("âœ… TodaysTrades test completed!")
@@ -0,0 +1,156 @@
+﻿"""
+Account Metrics Models
+
+Handles account balance and performance data.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Any
+from .rules_base import RuleValidator
+from .codegen import generate_from_dict, generate_to_dict
+
+@generate_from_dict()
+@generate_to_dict()
+@dataclass(slots=True)
+class AccountBalance:
+    """Account balance information."""
+    cash: float = 0.0
+    buying_power: float = 0.0
+    equity: float = 0.0
+    margin_used: float = 0.0
+    margin_available: float = 0.0
+    unrealized_pnl: float = 0.0
+    realized_pnl: float = 0.0
+    
+    def validate(self) -> bool:
+        """Validate balance data."""
+        try:
+            RuleValidator.validate_positive_float(self.cash, "Cash")
+            RuleValidator.validate_positive_float(self.buying_power, "Buying Power")
+            RuleValidator.validate_positive_float(self.equity, "Equity")
+            RuleValidator.validate_positive_float(self.margin_used, "Margin Used")
+            RuleValidator.validate_positive_float(self.margin_available, "Margin Available")
+            return True
+        except ValueError as e:
+            raise ValueError(f"Account Balance validation failed: {e}")
+    
+    def get_margin_utilization(self) -> float:
+        """Calculate margin utilization percentage."""
+        if self.buying_power > 0:
+            return (self.margin_used / self.buying_power) * 100
+        return 0.0
+    
+    def get_total_pnl(self) -> float:
+        """Get total P&L (realized + unrealized)."""
+        return self.realized_pnl + self.unrealized_pnl
+    
+    def is_margin_call_risk(self, threshold: float = 80.0) -> bool:
+        """Check if account is at risk of margin call."""
+        return self.get_margin_utilization() >= threshold
+    
+    def get_balance_status(self) -> Dict[str, Any]:
+        """Get comprehensive balance status."""
+        return {
+            "cash": self.cash,
+            "buying_power": self.buying_power,
+            "equity": self.equity,
+            "margin_used": self.margin_used,
+            "margin_available": self.margin_available,
+            "unrealized_pnl": self.unrealized_pnl,
+            "realized_pnl": self.realized_pnl,
+            "total_pnl": self.get_total_pnl(),
+            "margin_utilization": self.get_margin_utilization(),
+            "margin_call_risk": self.is_margin_call_risk()
+        }
+
+@generate_from_dict()
+@generate_to_dict()
+@dataclass(slots=True)
+class AccountPerformance:
+    """Account performance metrics."""
+    total_trades: int = 0
+    winning_trades: int = 0
+    losing_trades: int = 0
+    win_rate: float = 0.0
+    average_win: float = 0.0
+    average_loss: float = 0.0
+    largest_win: float = 0.0
+    largest_loss: float = 0.0
+    total_pnl: float = 0.0
+    daily_pnl: float = 0.0
+    monthly_pnl: float = 0.0
+    
+    def validate(self) -> bool:
+        """Validate performance data."""
+        try:
+            RuleValidator.validate_positive_int(self.total_trades, "Total Trades")
+            RuleValidator.validate_positive_int(self.winning_trades, "Winning Trades")
+            RuleValidator.validate_positive_int(self.losing_trades, "Losing Trades")
+            RuleValidator.validate_range(self.win_rate, "Win Rate", 0.0, 100.0)
+            return True
+        except ValueError as e:
+            raise ValueError(f"Account Performance validation failed: {e}")
+    
+    def record_trade(self, pnl: float):
+        """Fold one closed trade into the counts, averages, extremes and total P&L."""
+        if pnl > 0:
+            wins = self.winning_trades
+            self.average_win = (self.average_win * wins + pnl) / (wins + 1)
+            self.largest_win = max(self.largest_win, pnl)
+            self.winning_trades = wins + 1
+        elif pnl < 0:
+            losses = self.losing_trades
+            self.average_loss = (self.average_loss * losses + pnl) / (losses + 1)
+            self.largest_loss = min(self.largest_loss, pnl)
+            self.losing_trades = losses + 1
+        total = self.total_trades + 1
+        self.total_trades = total
+        self.win_rate = (self.winning_trades / total) * 100
+        self.total_pnl += pnl
+    
+    def calculate_win_rate(self) -> float:
+        """Calculate win rate percentage."""
+        if self.total_trades > 0:
+            return (self.winning_trades / self.total_trades) * 100
+        return 0.0
+    
+    def get_profit_factor(self) -> float:
+        """Calculate profit factor (gross profit / gross loss)."""
+        gross_profit = self.winning_trades * self.average_win
+        gross_loss = self.losing_trades * abs(self.average_loss)
+        
+        if gross_loss > 0:
+            return gross_profit / gross_loss
+        return 0.0 if gross_profit == 0 else float('inf')
+    
+    def get_performance_status(self) -> Dict[str, Any]:
+        """Get comprehensive performance status."""
+        return {
+            "total_trades": self.total_trades,
+            "winning_trades": self.winning_trades,
+            "losing_trades": self.losing_trades,
+            "win_rate": self.calculate_win_rate(),
+            "average_win": self.average_win,
+            "average_loss": self.average_loss,
+            "largest_win": self.largest_win,
+            "largest_loss": self.largest_loss,
+            "total_pnl": self.total_pnl,
+            "daily_pnl": self.daily_pnl,
+            "monthly_pnl": self.monthly_pnl,
+            "profit_factor": self.get_profit_factor()
+        }
+
+if __name__ == "__main__":
+    print("Testing account metrics models...")
+    
+    # Test AccountBalance
+    balance = AccountBalance.from_dict({"cash": 10000.0, "buying_power": 9500.0, "margin_used": 950.0})
+    print(f"âœ… Balance status: {balance.get_balance_status()}")
+    
+    # Test AccountPerformance
+    performance = AccountPerformance()
+    performance.record_trade(150.0)
+    performance.record_trade(-100.0)
+    print(f"âœ… Performance status: {performance.get_performance_status()}")
+    
+    print("âœ… Account metrics test completed!")
@@ -0,0 +1,120 @@
+﻿"""
+Model Code Generation
+
+Builds per-class serializers from dataclass fields once, at class definition time.
+"""
+
+import abc
+from dataclasses import MISSING, fields
+from typing import Any, Callable, Dict, Optional, Tuple
+
+def _compile_method(cls, name: str, source: str, namespace: Dict[str, Any], doc: str) -> Callable:
+    """
+    Compile generated method source for a class.
+
+    Args:
+        cls: Class receiving the method
+        name: Method name defined by the source
+        source: Python source of a single function definition
+        namespace: Globals visible to the generated function
+        doc: Docstring for the generated method
+
+    Returns:
+        The compiled function
+    """
+    exec(compile(source, f"<generated {cls.__name__}.{name}>", "exec"), namespace)
+    func = namespace[name]
+    func.__qualname__ = f"{cls.__qualname__}.{name}"
+    func.__module__ = cls.__module__
+    func.__doc__ = doc
+    return func
+
+def generate_to_dict(leading: Tuple[str, ...] = ()):
+    """
+    Class decorator that generates a flat to_dict() from the dataclass fields.
+
+    The generated method builds one dict literal, the same code a hand-written
+    to_dict would contain, so it stays as fast while following field changes.
+    Only init fields are serialized; init=False fields hold caches and derived values.
+    Apply it above @dataclass.
+
+    Args:
+        leading: Non-field attributes to emit first (e.g. BaseRule's 'enabled')
+
+    Returns:
+        Class decorator
+    """
+    def decorate(cls):
+        names = leading + tuple(field.name for field in fields(cls) if field.init)
+        cls._field_names = names
+
+        items = ", ".join(f"{name!r}: self.{name}" for name in names)
+        source = f"def to_dict(self):\n    return {{{items}}}\n"
+        cls.to_dict = _compile_method(cls, "to_dict", source, {}, "Convert to dictionary for storage.")
+
+        # to_dict may be abstract on the base (BaseRule); recompute now that it exists
+        abc.update_abstractmethods(cls)
+        return cls
+
+    return decorate
+
+def generate_from_dict(extra: Optional[Dict[str, Any]] = None):
+    """
+    Class decorator that generates a from_dict() classmethod from the dataclass fields.
+
+    The generated constructor binds data.get once and passes every init field
+    positionally, with each field's own default; required fields are read with
+    data[name] and raise KeyError when absent. Apply it above @dataclass.
+
+    Args:
+        extra: Non-field attributes to read after construction, mapped to their defaults
+
+    Returns:
+        Class decorator
+    """
+    extra = extra or {}
+
+    def decorate(cls):
+        namespace: Dict[str, Any] = {}
+        args = []
+        for index, field in enumerate(f for f in fields(cls) if f.init):
+            if field.default is not MISSING:
+                namespace[f"_default_{index}"] = field.default
+                value = f"get({field.name!r}, _default_{index})"
+            elif field.default_factory is not MISSING:
+                namespace[f"_factory_{index}"] = field.default_factory
+                value = f"(data[{field.name!r}] if {field.name!r} in data else _factory_{index}())"
+            else:
+                value = f"data[{field.name!r}]"
+            args.append(f"{field.name}={value}" if field.kw_only is True else value)
+
+        lines = ["def from_dict(cls, data):", "    get = data.get", f"    obj = cls({', '.join(args)})"]
+        for index, (name, default) in enumerate(extra.items()):
+            namespace[f"_extra_{index}"] = default
+            lines.append(f"    obj.{name} = get({name!r}, _extra_{index})")
+        lines.append("    return obj")
+
+        from_dict = _compile_method(cls, "from_dict", "\n".join(lines) + "\n", namespace, "Create from dictionary.")
+        cls.from_dict = classmethod(from_dict)
+        abc.update_abstractmethods(cls)
+        return cls
+
+    return decorate
+
+if __name__ == "__main__":
+    from dataclasses import dataclass
+
+    print("Testing model code generation...")
+
+    @generate_from_dict()
+    @generate_to_dict()
+    @dataclass(slots=True)
+    class Sample:
+        size: int = 1
+        price: float = 2.5
+
+    print(f"✅ Field names: {Sample._field_names}")
+    print(f"✅ to_dict: {Sample().to_dict()}")
+    print(f"✅ from_dict: {Sample.from_dict({'price': 3.0})}")
+
+    print("✅ Model code generation test completed!")
@@ -18,35 +18,53 @@ class RiskRules:
         # Try to import rule modules (they may not exist yet)
         self._initialize_rule_modules()
     
-    def _initialize_rule_modules(self):
-        """Initialize rule modules with error handling."""
+    # (DailyLimits, PositionLimits, TradingHours, SessionRules), None where the module is missing;
+    # probed once per process rather than on every construction
+    _rule_classes = None
+    
+    @classmethod
+    def _load_rule_classes(cls):
+        """Import the optional rule modules once and remember which exist."""
         try:
             from .rules_daily import DailyLimits
-            self.daily_limits = DailyLimits()
         except ImportError:
             # DailyLimits module not created yet
-            pass
+            DailyLimits = None
         
         try:
             from .rules_position import PositionLimits
-            self.position_limits = PositionLimits()
         except ImportError:
             # PositionLimits module not created yet
-            pass
+            PositionLimits = None
         
         try:
             from .rules_hours import TradingHours
-            self.trading_hours = TradingHours()
         except ImportError:
             # TradingHours module not created yet
-            pass
+            TradingHours = None
         
         try:
             from .rules_session import SessionRules
-            self.session_rules = SessionRules()
         except ImportError:
             # SessionRules module not created yet
-            pass
+            SessionRules = None
+        
+        cls._rule_classes = (DailyLimits, PositionLimits, TradingHours, SessionRules)
+        return cls._rule_classes
+    
+    def _initialize_rule_modules(self):
+        """Initialize rule modules with error handling."""
+        rule_classes = RiskRules._rule_classes or RiskRules._load_rule_classes()
+        daily_cls, position_cls, hours_cls, session_cls = rule_classes
+        
+        if daily_cls is not None:
+            self.daily_limits = daily_cls()
+        if position_cls is not None:
+            self.position_limits = position_cls()
+        if hours_cls is not None:
+            self.trading_hours = hours_cls()
+        if session_cls is not None:
+            self.session_rules = session_cls()
     
     def add_custom_rule(self, rule_name: str, rule):
         """Add a custom rule type."""
@@ -4,12 +4,23 @@ Base Rule Class
 Foundation for all rule types - makes adding new rules easy.
 """
 
+import re
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional
 
+# Valid 24-hour HH:MM clock times, 00:00-23:59
+_TIME_RE = re.compile(r'(?:[01][0-9]|2[0-3]):[0-5][0-9]')
+
+def time_to_minutes(time_str: str) -> int:
+    """Convert a validated HH:MM string to minutes since midnight."""
+    return int(time_str[:2]) * 60 + int(time_str[3:5])
+
 class BaseRule(ABC):
     """Base class for all rule types."""
     
+    # Slotted so rules declared with @dataclass(slots=True) carry no __dict__
+    __slots__ = ('enabled',)
+    
     def __init__(self, enabled: bool = True):
         """Initialize base rule."""
         self.enabled = enabled
@@ -52,14 +63,16 @@ class RuleValidator:
     @staticmethod
     def validate_positive_float(value: float, name: str) -> bool:
         """Validate that a float value is positive."""
-        if not isinstance(value, (int, float)) or value < 0:
+        # Exact type checks first; isinstance only for subclasses such as bool
+        t = type(value)
+        if (t is not float and t is not int and not isinstance(value, (int, float))) or value < 0:
             raise ValueError(f"{name} must be a positive number")
         return True
     
     @staticmethod
     def validate_positive_int(value: int, name: str) -> bool:
         """Validate that an int value is positive."""
-        if not isinstance(value, int) or value < 0:
+        if (type(value) is not int and not isinstance(value, int)) or value < 0:
             raise ValueError(f"{name} must be a positive integer")
         return True
     
@@ -69,11 +82,7 @@ class RuleValidator:
         if not isinstance(time_str, str) or len(time_str) != 5 or time_str[2] != ':':
             raise ValueError(f"{name} must be in HH:MM format")
         
-        try:
-            hour, minute = map(int, time_str.split(':'))
-            if not (0 <= hour <= 23 and 0 <= minute <= 59):
-                raise ValueError
-        except ValueError:
+        if _TIME_RE.fullmatch(time_str) is None:
             raise ValueError(f"{name} must be a valid time (00:00-23:59)")
         
         return True
@@ -84,17 +93,9 @@ class RuleValidator:
         RuleValidator.validate_time_format(start_time, f"{name} start")
         RuleValidator.validate_time_format(end_time, f"{name} end")
         
-        try:
-            from datetime import datetime
-            start = datetime.strptime(start_time, '%H:%M')
-            end = datetime.strptime(end_time, '%H:%M')
-            
-            if start >= end:
-                raise ValueError(f"{name} start time must be before end time")
-        except ValueError as e:
-            if "start time must be before" in str(e):
-                raise e
-            raise ValueError(f"Invalid {name} time format")
+        # Both strings are valid HH:MM here, so they convert without strptime
+        if time_to_minutes(start_time) >= time_to_minutes(end_time):
+            raise ValueError(f"{name} start time must be before end time")
         
         return True
     
@@ -115,7 +116,9 @@ class RuleValidator:
     @staticmethod
     def validate_range(value: float, name: str, min_val: float, max_val: float) -> bool:
         """Validate that a value is within a range."""
-        if not isinstance(value, (int, float)) or value < min_val or value > max_val:
+        t = type(value)
+        if ((t is not float and t is not int and not isinstance(value, (int, float)))
+                or value < min_val or value > max_val):
             raise ValueError(f"{name} must be between {min_val} and {max_val}")
         return True
 
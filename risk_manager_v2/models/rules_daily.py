@@ -4,43 +4,53 @@ Daily Limits Rule
 Handles daily loss, profit, and trade count limits.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Dict, Any, Optional
 from .rules_base import BaseRule, RuleValidator
+from .codegen import generate_from_dict, generate_to_dict
 
-@dataclass
+# Distinct (loss, profit, trades, volume) inputs remembered by get_risk_status
+RISK_STATUS_CACHE_SIZE = 4
+
+_INF = float('inf')
+
+@generate_from_dict(extra={"enabled": True})
+@generate_to_dict(leading=("enabled",))
+@dataclass(slots=True)
 class DailyLimits(BaseRule):
     """Daily trading limits."""
     max_daily_loss: float = 1000.0
     daily_profit_target: float = 2000.0
     max_daily_trades: int = 10
     max_daily_volume: float = 100000.0
+    _risk_status_cache: Optional[Dict[tuple, Dict[str, Any]]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Initialize after dataclass creation."""
-        super().__init__(enabled=True)
-    
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for storage."""
-        return {
-            "enabled": self.enabled,
-            "max_daily_loss": self.max_daily_loss,
-            "daily_profit_target": self.daily_profit_target,
-            "max_daily_trades": self.max_daily_trades,
-            "max_daily_volume": self.max_daily_volume
-        }
-    
-    @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'DailyLimits':
-        """Create from dictionary."""
-        limits = cls(
-            max_daily_loss=data.get("max_daily_loss", 1000.0),
-            daily_profit_target=data.get("daily_profit_target", 2000.0),
-            max_daily_trades=data.get("max_daily_trades", 10),
-            max_daily_volume=data.get("max_daily_volume", 100000.0)
-        )
-        limits.enabled = data.get("enabled", True)
-        return limits
+        # Zero-argument super() is unavailable in slots=True dataclasses
+        self.enabled = True
+    
+    # Breach thresholds: the limit while it is enforced, otherwise inf (never breached).
+    # Computed from the fields on every read, so direct writes to a limit take effect at once
+    @property
+    def loss_threshold(self) -> float:
+        """Daily loss at which the loss limit is breached."""
+        return self.max_daily_loss if self.enabled and self.max_daily_loss > 0 else _INF
+    
+    @property
+    def profit_threshold(self) -> float:
+        """Daily profit at which the profit target is hit."""
+        return self.daily_profit_target if self.enabled and self.daily_profit_target > 0 else _INF
+    
+    @property
+    def trades_threshold(self) -> float:
+        """Daily trade count at which the trade limit is exceeded."""
+        return self.max_daily_trades if self.enabled and self.max_daily_trades > 0 else _INF
+    
+    @property
+    def volume_threshold(self) -> float:
+        """Daily volume at which the volume limit is exceeded."""
+        return self.max_daily_volume if self.enabled and self.max_daily_volume > 0 else _INF
     
     def validate(self) -> bool:
         """Validate daily limits."""
@@ -66,27 +76,19 @@ class DailyLimits(BaseRule):
     
     def is_daily_loss_breached(self, current_loss: float) -> bool:
         """Check if daily loss limit is breached."""
-        if not self.enabled or self.max_daily_loss <= 0:
-            return False
-        return current_loss >= self.max_daily_loss
+        return current_loss >= self.loss_threshold
     
     def is_daily_profit_hit(self, current_profit: float) -> bool:
         """Check if daily profit target is hit."""
-        if not self.enabled or self.daily_profit_target <= 0:
-            return False
-        return current_profit >= self.daily_profit_target
+        return current_profit >= self.profit_threshold
     
     def is_trade_count_exceeded(self, current_trades: int) -> bool:
         """Check if daily trade count is exceeded."""
-        if not self.enabled or self.max_daily_trades <= 0:
-            return False
-        return current_trades >= self.max_daily_trades
+        return current_trades >= self.trades_threshold
     
     def is_volume_exceeded(self, current_volume: float) -> bool:
         """Check if daily volume limit is exceeded."""
-        if not self.enabled or self.max_daily_volume <= 0:
-            return False
-        return current_volume >= self.max_daily_volume
+        return current_volume >= self.volume_threshold
     
     def get_remaining_loss_capacity(self, current_loss: float) -> float:
         """Get remaining loss capacity before limit is hit."""
@@ -114,21 +116,51 @@ class DailyLimits(BaseRule):
     
     def get_risk_status(self, current_loss: float, current_profit: float, 
                        current_trades: int, current_volume: float) -> Dict[str, Any]:
-        """Get comprehensive risk status for all daily limits."""
-        return {
-            "loss_breached": self.is_daily_loss_breached(current_loss),
-            "profit_hit": self.is_daily_profit_hit(current_profit),
-            "trades_exceeded": self.is_trade_count_exceeded(current_trades),
-            "volume_exceeded": self.is_volume_exceeded(current_volume),
-            "remaining_loss": self.get_remaining_loss_capacity(current_loss),
-            "remaining_profit": self.get_remaining_profit_needed(current_profit),
-            "remaining_trades": self.get_remaining_trades(current_trades),
-            "remaining_volume": self.get_remaining_volume(current_volume),
-            "loss_percentage": (current_loss / self.max_daily_loss * 100) if self.max_daily_loss > 0 else 0,
-            "profit_percentage": (current_profit / self.daily_profit_target * 100) if self.daily_profit_target > 0 else 0,
-            "trades_percentage": (current_trades / self.max_daily_trades * 100) if self.max_daily_trades > 0 else 0,
-            "volume_percentage": (current_volume / self.max_daily_volume * 100) if self.max_daily_volume > 0 else 0
+        """Get comprehensive risk status for all daily limits (cached per input and limits; treat as read-only)."""
+        # The limits are part of the key, so a changed limit or enabled flag is never served a stale status
+        key = (current_loss, current_profit, current_trades, current_volume, self.enabled,
+               self.max_daily_loss, self.daily_profit_target, self.max_daily_trades, self.max_daily_volume)
+        cache = self._risk_status_cache
+        if cache is None:
+            cache = self._risk_status_cache = {}
+        else:
+            status = cache.get(key)
+            if status is not None:
+                return status
+            if len(cache) >= RISK_STATUS_CACHE_SIZE:
+                del cache[next(iter(cache))]
+        
+        # One pass over local scalars instead of eight helper calls that each re-check enabled
+        enabled = self.enabled
+        max_loss = self.max_daily_loss
+        profit_target = self.daily_profit_target
+        max_trades = self.max_daily_trades
+        max_volume = self.max_daily_volume
+        loss_active = enabled and max_loss > 0
+        profit_active = enabled and profit_target > 0
+        trades_active = enabled and max_trades > 0
+        volume_active = enabled and max_volume > 0
+        
+        remaining_loss = max_loss - current_loss
+        remaining_profit = profit_target - current_profit
+        remaining_trades = max_trades - current_trades
+        remaining_volume = max_volume - current_volume
+        
+        status = cache[key] = {
+            "loss_breached": loss_active and current_loss >= max_loss,
+            "profit_hit": profit_active and current_profit >= profit_target,
+            "trades_exceeded": trades_active and current_trades >= max_trades,
+            "volume_exceeded": volume_active and current_volume >= max_volume,
+            "remaining_loss": (remaining_loss if remaining_loss > 0 else 0) if loss_active else _INF,
+            "remaining_profit": (remaining_profit if remaining_profit > 0 else 0) if profit_active else 0,
+            "remaining_trades": (remaining_trades if remaining_trades > 0 else 0) if trades_active else _INF,
+            "remaining_volume": (remaining_volume if remaining_volume > 0 else 0) if volume_active else _INF,
+            "loss_percentage": (current_loss / max_loss * 100) if max_loss > 0 else 0,
+            "profit_percentage": (current_profit / profit_target * 100) if profit_target > 0 else 0,
+            "trades_percentage": (current_trades / max_trades * 100) if max_trades > 0 else 0,
+            "volume_percentage": (current_volume / max_volume * 100) if max_volume > 0 else 0
         }
+        return status
 
 if __name__ == "__main__":
     print("Testing DailyLimits...")
@@ -148,6 +180,10 @@ if __name__ == "__main__":
     status = daily_limits.get_risk_status(500.0, 1000.0, 5, 50000.0)
     print(f"âœ… Risk status: {status}")
     
+    # Test limit updates
+    daily_limits.max_daily_loss = 400.0
+    print(f"âœ… Loss breached after update: {daily_limits.is_daily_loss_breached(500.0)}")
+    
     # Test to_dict/from_dict
     data = daily_limits.to_dict()
     restored = DailyLimits.from_dict(data)
@@ -4,15 +4,47 @@ Trading Hours Rule
 Handles trading hours and timezone configuration.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from datetime import datetime, time
-import pytz
+from datetime import datetime, time, tzinfo
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 from .rules_base import BaseRule, RuleValidator
+from .rules_hours_sessions import TradingHoursSessions
 
-@dataclass
-class TradingHours(BaseRule):
-    """Trading hours configuration."""
+@lru_cache(maxsize=64)
+def _get_tz(name: str) -> tzinfo:
+    """Resolve a timezone name once per process; zones are shared and immutable."""
+    return ZoneInfo(name)
+
+@lru_cache(maxsize=256)
+def _parse_minutes(time_str: str) -> Optional[int]:
+    """
+    Parse 'HH:MM' to minutes since midnight, or None if it is not a time (validate() reports that).
+    
+    Cached: every TradingHours parses its six time fields, and configs reuse a handful of times.
+    """
+    try:
+        hour, minute = time_str.split(':')
+        return int(hour) * 60 + int(minute)
+    except (AttributeError, ValueError):
+        return None
+
+# Settings update_hours() accepts
+_HOURS_FIELDS = frozenset((
+    'start_time', 'end_time', 'timezone', 'pre_market_start', 'pre_market_end',
+    'after_hours_start', 'after_hours_end', 'enable_pre_market', 'enable_after_hours',
+    'allow_regular', 'allow_pre_market', 'allow_after_hours'))
+
+@dataclass(slots=True, frozen=True)
+class TradingHours(TradingHoursSessions, BaseRule):
+    """
+    Trading hours configuration; the session checks come from TradingHoursSessions.
+    
+    Read-only: the parsed minutes and the minute table are derived from the settings,
+    so change them through update_hours(), enable() and disable(), which keep those in step.
+    Direct assignment raises dataclasses.FrozenInstanceError instead of leaving a stale window.
+    """
     start_time: str = "09:30"
     end_time: str = "16:00"
     timezone: str = "America/New_York"
@@ -25,10 +57,78 @@ class TradingHours(BaseRule):
     allow_regular: bool = True
     allow_pre_market: bool = False
     allow_after_hours: bool = False
+    _tz: Optional[tzinfo] = field(default=None, init=False, repr=False, compare=False)
+    
+    # Each time field as minutes since midnight, parsed by _refresh_derived()
+    _start_min: Optional[int] = field(init=False, repr=False, compare=False)
+    _end_min: Optional[int] = field(init=False, repr=False, compare=False)
+    _pre_market_start_min: Optional[int] = field(init=False, repr=False, compare=False)
+    _pre_market_end_min: Optional[int] = field(init=False, repr=False, compare=False)
+    _after_hours_start_min: Optional[int] = field(init=False, repr=False, compare=False)
+    _after_hours_end_min: Optional[int] = field(init=False, repr=False, compare=False)
+    
+    # Bumped on every settings change so derived caches (e.g. in TradingHoursAdvanced) can detect edits
+    _config_version: int = field(default=0, init=False, repr=False, compare=False)
+    
+    # Per minute of the day: 1 if trading is allowed, 2 if allowed only on the exact closing minute;
+    # rebuilt on first use after the settings change
+    _minute_table: Optional[bytearray] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Initialize after dataclass creation."""
-        super().__init__(enabled=True)
+        # Zero-argument super() is unavailable in slots=True dataclasses; frozen, so write through object
+        object.__setattr__(self, 'enabled', True)
+        self._refresh_derived()
+    
+    def _refresh_derived(self):
+        """Re-parse the time fields and drop the resolved timezone and every cache built from the settings."""
+        set_attr = object.__setattr__
+        set_attr(self, '_start_min', _parse_minutes(self.start_time))
+        set_attr(self, '_end_min', _parse_minutes(self.end_time))
+        set_attr(self, '_pre_market_start_min', _parse_minutes(self.pre_market_start))
+        set_attr(self, '_pre_market_end_min', _parse_minutes(self.pre_market_end))
+        set_attr(self, '_after_hours_start_min', _parse_minutes(self.after_hours_start))
+        set_attr(self, '_after_hours_end_min', _parse_minutes(self.after_hours_end))
+        set_attr(self, '_tz', None)
+        self._invalidate()
+    
+    def _invalidate(self):
+        """Drop caches built from the settings and bump _config_version."""
+        object.__setattr__(self, '_config_version', self._config_version + 1)
+        object.__setattr__(self, '_minute_table', None)
+    
+    def enable(self) -> None:
+        """Enable the rule."""
+        object.__setattr__(self, 'enabled', True)
+        self._invalidate()
+    
+    def disable(self) -> None:
+        """Disable the rule."""
+        object.__setattr__(self, 'enabled', False)
+        self._invalidate()
+    
+    def update_hours(self, **changes: Any) -> None:
+        """
+        Change one or more trading hours settings; the only way to change them after construction.
+        
+        Args:
+            **changes: New values keyed by field name (e.g. start_time="08:00", timezone="Europe/London")
+        """
+        unknown = changes.keys() - _HOURS_FIELDS
+        if unknown:
+            raise ValueError(f"Unknown trading hours setting(s): {', '.join(sorted(unknown))}")
+        for name, value in changes.items():
+            object.__setattr__(self, name, value)
+        self._refresh_derived()
+    
+    @property
+    def tz(self) -> tzinfo:
+        """Timezone object for self.timezone, resolved on first use."""
+        tz = self._tz
+        if tz is None:
+            tz = _get_tz(self.timezone)
+            object.__setattr__(self, '_tz', tz)
+        return tz
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
@@ -65,7 +165,8 @@ class TradingHours(BaseRule):
             allow_pre_market=data.get("allow_pre_market", False),
             allow_after_hours=data.get("allow_after_hours", False)
         )
-        hours.enabled = data.get("enabled", True)
+        if not data.get("enabled", True):
+            hours.disable()
         return hours
     
     def validate(self) -> bool:
@@ -84,10 +185,10 @@ class TradingHours(BaseRule):
             RuleValidator.validate_time_range(self.pre_market_start, self.pre_market_end, "Pre-Market")
             RuleValidator.validate_time_range(self.after_hours_start, self.after_hours_end, "After-Hours")
             
-            # Validate timezone
+            # Validate timezone; known names are answered from the _get_tz cache
             try:
-                pytz.timezone(self.timezone)
-            except pytz.exceptions.UnknownTimeZoneError:
+                _get_tz(self.timezone)
+            except (ZoneInfoNotFoundError, ValueError):
                 raise ValueError(f"Invalid timezone: {self.timezone}")
             
             # Validate boolean fields
@@ -101,85 +202,6 @@ class TradingHours(BaseRule):
         except ValueError as e:
             raise ValueError(f"Trading Hours validation failed: {e}")
     
-    def is_within_trading_hours(self, current_time: datetime = None) -> bool:
-        """Check if current time is within trading hours."""
-        if not self.enabled:
-            return True  # If disabled, always allow trading
-        
-        if current_time is None:
-            current_time = datetime.now()
-        
-        # Convert current time to trading timezone
-        tz = pytz.timezone(self.timezone)
-        current_time = current_time.astimezone(tz)
-        
-        # Check regular trading hours
-        if self.allow_regular and self._is_within_time_range(current_time, self.start_time, self.end_time):
-            return True
-        
-        # Check pre-market hours
-        if self.allow_pre_market and self.enable_pre_market and self._is_within_time_range(current_time, self.pre_market_start, self.pre_market_end):
-            return True
-        
-        # Check after-hours
-        if self.allow_after_hours and self.enable_after_hours and self._is_within_time_range(current_time, self.after_hours_start, self.after_hours_end):
-            return True
-        
-        return False
-    
-    def is_outside_trading_hours(self, current_time: datetime = None) -> bool:
-        """Check if current time is outside trading hours."""
-        return not self.is_within_trading_hours(current_time)
-    
-    def is_pre_market_time(self, current_time: datetime = None) -> bool:
-        """Check if current time is during pre-market hours."""
-        if not self.enabled or not self.enable_pre_market or not self.allow_pre_market:
-            return False
-        
-        if current_time is None:
-            current_time = datetime.now()
-        
-        tz = pytz.timezone(self.timezone)
-        current_time = current_time.astimezone(tz)
-        
-        return self._is_within_time_range(current_time, self.pre_market_start, self.pre_market_end)
-    
-    def is_after_hours_time(self, current_time: datetime = None) -> bool:
-        """Check if current time is during after-hours."""
-        if not self.enabled or not self.enable_after_hours or not self.allow_after_hours:
-            return False
-        
-        if current_time is None:
-            current_time = datetime.now()
-        
-        tz = pytz.timezone(self.timezone)
-        current_time = current_time.astimezone(tz)
-        
-        return self._is_within_time_range(current_time, self.after_hours_start, self.after_hours_end)
-    
-    def is_regular_trading_time(self, current_time: datetime = None) -> bool:
-        """Check if current time is during regular trading hours."""
-        if not self.enabled or not self.allow_regular:
-            return False
-        
-        if current_time is None:
-            current_time = datetime.now()
-        
-        tz = pytz.timezone(self.timezone)
-        current_time = current_time.astimezone(tz)
-        
-        return self._is_within_time_range(current_time, self.start_time, self.end_time)
-    
-    def _is_within_time_range(self, current_time: datetime, start_time: str, end_time: str) -> bool:
-        """Check if current time is within a specific time range."""
-        start_hour, start_minute = map(int, start_time.split(':'))
-        end_hour, end_minute = map(int, end_time.split(':'))
-        
-        start_time_obj = current_time.replace(hour=start_hour, minute=start_minute, second=0, microsecond=0)
-        end_time_obj = current_time.replace(hour=end_hour, minute=end_minute, second=0, microsecond=0)
-        
-        return start_time_obj <= current_time <= end_time_obj
-    
     def get_trading_hours_display(self) -> str:
         """Get formatted trading hours string."""
         hours_str = f"Regular: {self.start_time} - {self.end_time}"
@@ -4,17 +4,29 @@ Trading Hours Advanced Features
 Advanced time calculations and status methods for trading hours.
 """
 
-from typing import Dict, Any, Optional
+from typing import Dict, Any, NamedTuple, Optional
 from datetime import datetime
-import pytz
 from .rules_hours import TradingHours
 
+class NextOpen(NamedTuple):
+    """Next session opening: when it opens, which session it is and how long it lasts."""
+    next_dt: datetime
+    session: str
+    duration_min: int
+
 class TradingHoursAdvanced:
     """Advanced trading hours functionality."""
     
+    __slots__ = ('trading_hours', '_status_cache', '_session_cache')
+    
     def __init__(self, trading_hours: TradingHours):
         """Initialize with a TradingHours instance."""
         self.trading_hours = trading_hours
+        
+        # (trading_hours, (epoch second, config version), result) of the latest call,
+        # so repeated polls within one wall-clock second reuse the same dict
+        self._status_cache = (None, None, None)
+        self._session_cache = (None, None, None)
     
     def get_time_until_open(self, current_time: datetime = None) -> str:
         """Get time until market opens."""
@@ -22,96 +34,115 @@ class TradingHoursAdvanced:
             return "Trading hours disabled"
         
         if current_time is None:
-            current_time = datetime.now()
+            current_time = datetime.now(self.trading_hours.tz)
         
-        tz = pytz.timezone(self.trading_hours.timezone)
-        current_time = current_time.astimezone(tz)
+        current_time = current_time.astimezone(self.trading_hours.tz)
         
         # Check if market is currently open
-        if self.trading_hours.is_within_trading_hours(current_time):
+        return self._format_time_until_open(current_time, any(self.trading_hours._session_flags(current_time)))
+    
+    def _format_time_until_open(self, current_time: datetime, is_open: bool) -> str:
+        """Describe the wait until the next opening for a time already in the trading timezone."""
+        if is_open:
             return "Market is open"
         
         # Find next opening time
         next_open = self._get_next_opening_time(current_time)
         if next_open:
-            time_diff = next_open - current_time
+            time_diff = next_open.next_dt - current_time
             hours = int(time_diff.total_seconds() // 3600)
             minutes = int((time_diff.total_seconds() % 3600) // 60)
             return f"{hours}h {minutes}m until open"
         
         return "Market closed"
     
-    def _get_next_opening_time(self, current_time: datetime) -> Optional[datetime]:
-        """Get the next market opening time."""
-        # Check regular trading hours first
-        if self.trading_hours.allow_regular:
-            start_hour, start_minute = map(int, self.trading_hours.start_time.split(':'))
-            today_open = current_time.replace(hour=start_hour, minute=start_minute, second=0, microsecond=0)
-            
-            if current_time < today_open:
-                return today_open
-        
-        # Check pre-market if enabled
-        if self.trading_hours.allow_pre_market and self.trading_hours.enable_pre_market:
-            start_hour, start_minute = map(int, self.trading_hours.pre_market_start.split(':'))
-            today_pre_open = current_time.replace(hour=start_hour, minute=start_minute, second=0, microsecond=0)
-            
-            if current_time < today_pre_open:
-                return today_pre_open
-        
-        # Check after-hours if enabled
-        if self.trading_hours.allow_after_hours and self.trading_hours.enable_after_hours:
-            start_hour, start_minute = map(int, self.trading_hours.after_hours_start.split(':'))
-            today_after_open = current_time.replace(hour=start_hour, minute=start_minute, second=0, microsecond=0)
-            
-            if current_time < today_after_open:
-                return today_after_open
+    def _get_next_opening_time(self, current_time: datetime) -> Optional[NextOpen]:
+        """Get the next market opening time with its session name and length in minutes."""
+        trading_hours = self.trading_hours
+        current_min = current_time.hour * 60 + current_time.minute
+        
+        # Regular trading hours first, then pre-market, then after-hours
+        windows = (
+            (trading_hours.allow_regular, trading_hours._start_min, trading_hours._end_min, "Regular Trading"),
+            (trading_hours.allow_pre_market and trading_hours.enable_pre_market,
+             trading_hours._pre_market_start_min, trading_hours._pre_market_end_min, "Pre-Market"),
+            (trading_hours.allow_after_hours and trading_hours.enable_after_hours,
+             trading_hours._after_hours_start_min, trading_hours._after_hours_end_min, "After-Hours")
+        )
+        for allowed, start_min, end_min, session in windows:
+            # Opening times fall on whole minutes, so comparing minutes matches comparing datetimes
+            if allowed and current_min < start_min:
+                start_hour, start_minute = divmod(start_min, 60)
+                next_dt = current_time.replace(hour=start_hour, minute=start_minute, second=0, microsecond=0)
+                return NextOpen(next_dt, session, end_min - start_min)
         
         return None
     
     def get_trading_status(self, current_time: datetime = None) -> Dict[str, Any]:
-        """Get comprehensive trading hours status."""
+        """Get comprehensive trading hours status (shared per wall-clock second; treat as read-only)."""
         if current_time is None:
-            current_time = datetime.now()
-        
-        return {
-            "enabled": self.trading_hours.enabled,
-            "within_trading_hours": self.trading_hours.is_within_trading_hours(current_time),
-            "outside_trading_hours": self.trading_hours.is_outside_trading_hours(current_time),
-            "is_pre_market": self.trading_hours.is_pre_market_time(current_time),
-            "is_after_hours": self.trading_hours.is_after_hours_time(current_time),
-            "is_regular_trading": self.trading_hours.is_regular_trading_time(current_time),
-            "time_until_open": self.get_time_until_open(current_time),
+            current_time = datetime.now(self.trading_hours.tz)
+        
+        trading_hours = self.trading_hours
+        key = (int(current_time.timestamp()), trading_hours._config_version)
+        cached_hours, cached_key, status = self._status_cache
+        if cached_hours is trading_hours and cached_key == key:
+            return status
+        
+        # Convert once and evaluate every session flag against the same local time
+        enabled = self.trading_hours.enabled
+        local_time = current_time.astimezone(self.trading_hours.tz)
+        regular, pre_market, after_hours = self.trading_hours._session_flags(local_time)
+        within = not enabled or regular or pre_market or after_hours
+        
+        status = {
+            "enabled": enabled,
+            "within_trading_hours": within,
+            "outside_trading_hours": not within,
+            "is_pre_market": pre_market,
+            "is_after_hours": after_hours,
+            "is_regular_trading": regular,
+            "time_until_open": self._format_time_until_open(local_time, within) if enabled else "Trading hours disabled",
             "current_timezone": self.trading_hours.timezone,
             "regular_hours": f"{self.trading_hours.start_time} - {self.trading_hours.end_time}",
             "pre_market_hours": f"{self.trading_hours.pre_market_start} - {self.trading_hours.pre_market_end}" if self.trading_hours.enable_pre_market else "Disabled",
             "after_hours": f"{self.trading_hours.after_hours_start} - {self.trading_hours.after_hours_end}" if self.trading_hours.enable_after_hours else "Disabled"
         }
+        self._status_cache = (trading_hours, key, status)
+        return status
     
     def get_session_info(self, current_time: datetime = None) -> Dict[str, Any]:
-        """Get detailed session information."""
+        """Get detailed session information (shared per wall-clock second; treat as read-only)."""
         if current_time is None:
-            current_time = datetime.now()
+            current_time = datetime.now(self.trading_hours.tz)
         
-        tz = pytz.timezone(self.trading_hours.timezone)
-        current_time = current_time.astimezone(tz)
+        trading_hours = self.trading_hours
+        key = (int(current_time.timestamp()), trading_hours._config_version)
+        cached_hours, cached_key, info = self._session_cache
+        if cached_hours is trading_hours and cached_key == key:
+            return info
         
-        return {
+        current_time = current_time.astimezone(self.trading_hours.tz)
+        regular, pre_market, after_hours = self.trading_hours._session_flags(current_time)
+        
+        info = {
             "current_time": current_time.strftime("%H:%M:%S"),
             "current_date": current_time.strftime("%Y-%m-%d"),
             "timezone": self.trading_hours.timezone,
-            "session_type": self._get_current_session_type(current_time),
+            "session_type": self._get_current_session_type(regular, pre_market, after_hours),
             "next_session": self._get_next_session_info(current_time),
-            "session_progress": self._get_session_progress(current_time)
+            "session_progress": self._get_session_progress(current_time, regular, pre_market, after_hours)
         }
+        self._session_cache = (trading_hours, key, info)
+        return info
     
-    def _get_current_session_type(self, current_time: datetime) -> str:
-        """Get the current session type."""
-        if self.trading_hours.is_regular_trading_time(current_time):
+    def _get_current_session_type(self, regular: bool, pre_market: bool, after_hours: bool) -> str:
+        """Get the current session type from the session flags."""
+        if regular:
             return "Regular Trading"
-        elif self.trading_hours.is_pre_market_time(current_time):
+        elif pre_market:
             return "Pre-Market"
-        elif self.trading_hours.is_after_hours_time(current_time):
+        elif after_hours:
             return "After-Hours"
         else:
             return "Closed"
@@ -122,63 +153,43 @@ class TradingHoursAdvanced:
         if not next_open:
             return {"session": "None", "time": "N/A", "duration": "N/A"}
         
-        time_diff = next_open - current_time
+        time_diff = next_open.next_dt - current_time
         hours = int(time_diff.total_seconds() // 3600)
         minutes = int((time_diff.total_seconds() % 3600) // 60)
+        duration_hours, duration_minutes = divmod(next_open.duration_min, 60)
         
-        # Determine session type
-        if self.trading_hours.allow_pre_market and self.trading_hours.enable_pre_market:
-            start_hour, start_minute = map(int, self.trading_hours.pre_market_start.split(':'))
-            pre_open = current_time.replace(hour=start_hour, minute=start_minute, second=0, microsecond=0)
-            if current_time < pre_open:
-                return {
-                    "session": "Pre-Market",
-                    "time": f"{hours}h {minutes}m",
-                    "duration": "5h 30m"
-                }
-        
-        if self.trading_hours.allow_regular:
-            start_hour, start_minute = map(int, self.trading_hours.start_time.split(':'))
-            reg_open = current_time.replace(hour=start_hour, minute=start_minute, second=0, microsecond=0)
-            if current_time < reg_open:
-                return {
-                    "session": "Regular Trading",
-                    "time": f"{hours}h {minutes}m",
-                    "duration": "6h 30m"
-                }
-        
-        return {"session": "After-Hours", "time": f"{hours}h {minutes}m", "duration": "4h"}
-    
-    def _get_session_progress(self, current_time: datetime) -> Dict[str, Any]:
-        """Get progress through current session."""
-        if self.trading_hours.is_regular_trading_time(current_time):
-            return self._calculate_session_progress(current_time, self.trading_hours.start_time, self.trading_hours.end_time, "Regular Trading")
-        elif self.trading_hours.is_pre_market_time(current_time):
-            return self._calculate_session_progress(current_time, self.trading_hours.pre_market_start, self.trading_hours.pre_market_end, "Pre-Market")
-        elif self.trading_hours.is_after_hours_time(current_time):
-            return self._calculate_session_progress(current_time, self.trading_hours.after_hours_start, self.trading_hours.after_hours_end, "After-Hours")
+        return {
+            "session": next_open.session,
+            "time": f"{hours}h {minutes}m",
+            "duration": f"{duration_hours}h {duration_minutes}m" if duration_minutes else f"{duration_hours}h"
+        }
+    
+    def _get_session_progress(self, current_time: datetime, regular: bool, pre_market: bool, after_hours: bool) -> Dict[str, Any]:
+        """Get progress through current session, given the session flags for current_time."""
+        if regular:
+            return self._calculate_session_progress(current_time, self.trading_hours._start_min, self.trading_hours._end_min, "Regular Trading")
+        elif pre_market:
+            return self._calculate_session_progress(current_time, self.trading_hours._pre_market_start_min, self.trading_hours._pre_market_end_min, "Pre-Market")
+        elif after_hours:
+            return self._calculate_session_progress(current_time, self.trading_hours._after_hours_start_min, self.trading_hours._after_hours_end_min, "After-Hours")
         else:
             return {"session": "Closed", "progress": 0, "elapsed": "0h 0m", "remaining": "0h 0m"}
     
-    def _calculate_session_progress(self, current_time: datetime, start_time: str, end_time: str, session_name: str) -> Dict[str, Any]:
-        """Calculate progress through a specific session."""
-        start_hour, start_minute = map(int, start_time.split(':'))
-        end_hour, end_minute = map(int, end_time.split(':'))
-        
-        session_start = current_time.replace(hour=start_hour, minute=start_minute, second=0, microsecond=0)
-        session_end = current_time.replace(hour=end_hour, minute=end_minute, second=0, microsecond=0)
-        
-        total_duration = session_end - session_start
-        elapsed = current_time - session_start
-        remaining = session_end - current_time
+    def _calculate_session_progress(self, current_time: datetime, start_min: int, end_min: int, session_name: str) -> Dict[str, Any]:
+        """Calculate progress through a session given in minutes since midnight."""
+        # Wall-clock offsets within the day, in microseconds so seconds stay exact
+        current_us = ((current_time.hour * 60 + current_time.minute) * 60 + current_time.second) * 1000000 + current_time.microsecond
+        elapsed = (current_us - start_min * 60000000) / 1000000
+        remaining = (end_min * 60000000 - current_us) / 1000000
+        total_duration = (end_min - start_min) * 60
         
-        progress = (elapsed.total_seconds() / total_duration.total_seconds()) * 100 if total_duration.total_seconds() > 0 else 0
+        progress = (elapsed / total_duration) * 100 if total_duration > 0 else 0
         
         return {
             "session": session_name,
             "progress": round(progress, 1),
-            "elapsed": f"{int(elapsed.total_seconds() // 3600)}h {int((elapsed.total_seconds() % 3600) // 60)}m",
-            "remaining": f"{int(remaining.total_seconds() // 3600)}h {int((remaining.total_seconds() % 3600) // 60)}m"
+            "elapsed": f"{int(elapsed // 3600)}h {int((elapsed % 3600) // 60)}m",
+            "remaining": f"{int(remaining // 3600)}h {int((remaining % 3600) // 60)}m"
         }
 
 if __name__ == "__main__":
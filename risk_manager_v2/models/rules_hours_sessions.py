@@ -0,0 +1,160 @@
+﻿"""
+Trading Hours Sessions
+
+Session checks (regular, pre-market, after-hours) for TradingHours.
+"""
+
+from datetime import datetime
+from typing import Iterable, List, Tuple
+
+class TradingHoursSessions:
+    """
+    Session predicates mixed into TradingHours.
+    
+    Reads the TradingHours settings, its parsed minute fields (_start_min etc.),
+    tz and the _minute_table cache; holds no state of its own.
+    """
+    
+    # Empty so TradingHours stays a fully slotted dataclass
+    __slots__ = ()
+    
+    def is_within_trading_hours(self, current_time: datetime = None) -> bool:
+        """Check if current time is within trading hours."""
+        if not self.enabled:
+            return True  # If disabled, always allow trading
+        
+        if current_time is None:
+            current_time = datetime.now(self.tz)
+        
+        # Convert current time to trading timezone
+        current_time = current_time.astimezone(self.tz)
+        allowed = self._allowed_minutes()[current_time.hour * 60 + current_time.minute]
+        return allowed == 1 or (allowed == 2 and not (current_time.second or current_time.microsecond))
+    
+    def _allowed_minutes(self) -> bytearray:
+        """
+        Lookup table over the 1440 minutes of the day for the sessions trading is allowed in.
+        
+        Each window runs from its start minute up to and including the exact closing
+        minute (hh:mm:00.000000), matching _is_within_time_range.
+        """
+        table = self._minute_table
+        if table is None:
+            windows = []
+            if self.allow_regular:
+                windows.append((self._start_min, self._end_min))
+            if self.allow_pre_market and self.enable_pre_market:
+                windows.append((self._pre_market_start_min, self._pre_market_end_min))
+            if self.allow_after_hours and self.enable_after_hours:
+                windows.append((self._after_hours_start_min, self._after_hours_end_min))
+            
+            table = bytearray(1440)
+            for start_min, end_min in windows:
+                table[start_min:end_min] = b'\x01' * (end_min - start_min)
+            # Closing minutes go last so a window opening on another's close keeps the whole minute
+            for start_min, end_min in windows:
+                if start_min <= end_min and not table[end_min]:
+                    table[end_min] = 2
+            # TradingHours is frozen; the table is a cache, not a setting
+            object.__setattr__(self, '_minute_table', table)
+        return table
+    
+    def is_within_trading_hours_batch(self, times: Iterable[datetime]) -> List[bool]:
+        """
+        Check many timestamps at once, e.g. when replaying trades in a backtest.
+        
+        Equivalent to [self.is_within_trading_hours(t) for t in times], but the timezone
+        and the allowed-minute table are resolved once for the whole batch.
+        """
+        if not self.enabled:
+            return [True for _ in times]
+        
+        table = self._allowed_minutes()
+        tz = self.tz
+        results = []
+        append = results.append
+        for current_time in times:
+            local_time = current_time.astimezone(tz)
+            allowed = table[local_time.hour * 60 + local_time.minute]
+            append(allowed == 1 or (allowed == 2 and not (local_time.second or local_time.microsecond)))
+        return results
+    
+    def is_outside_trading_hours(self, current_time: datetime = None) -> bool:
+        """Check if current time is outside trading hours."""
+        return not self.is_within_trading_hours(current_time)
+    
+    def is_pre_market_time(self, current_time: datetime = None) -> bool:
+        """Check if current time is during pre-market hours."""
+        if not self.enabled or not self.enable_pre_market or not self.allow_pre_market:
+            return False
+        
+        if current_time is None:
+            current_time = datetime.now(self.tz)
+        
+        current_time = current_time.astimezone(self.tz)
+        
+        return self._is_within_time_range(current_time, self._pre_market_start_min, self._pre_market_end_min)
+    
+    def is_after_hours_time(self, current_time: datetime = None) -> bool:
+        """Check if current time is during after-hours."""
+        if not self.enabled or not self.enable_after_hours or not self.allow_after_hours:
+            return False
+        
+        if current_time is None:
+            current_time = datetime.now(self.tz)
+        
+        current_time = current_time.astimezone(self.tz)
+        
+        return self._is_within_time_range(current_time, self._after_hours_start_min, self._after_hours_end_min)
+    
+    def is_regular_trading_time(self, current_time: datetime = None) -> bool:
+        """Check if current time is during regular trading hours."""
+        if not self.enabled or not self.allow_regular:
+            return False
+        
+        if current_time is None:
+            current_time = datetime.now(self.tz)
+        
+        current_time = current_time.astimezone(self.tz)
+        
+        return self._is_within_time_range(current_time, self._start_min, self._end_min)
+    
+    def _session_flags(self, local_time: datetime) -> Tuple[bool, bool, bool]:
+        """
+        Evaluate (regular, pre-market, after-hours) for a time already converted to self.tz.
+        
+        Each flag matches the corresponding is_*_time() predicate, so callers needing
+        several of them pay for one timezone conversion instead of one per predicate.
+        """
+        if not self.enabled:
+            return False, False, False
+        
+        regular = self.allow_regular and self._is_within_time_range(
+            local_time, self._start_min, self._end_min)
+        pre_market = self.enable_pre_market and self.allow_pre_market and self._is_within_time_range(
+            local_time, self._pre_market_start_min, self._pre_market_end_min)
+        after_hours = self.enable_after_hours and self.allow_after_hours and self._is_within_time_range(
+            local_time, self._after_hours_start_min, self._after_hours_end_min)
+        return regular, pre_market, after_hours
+    
+    def _is_within_time_range(self, current_time: datetime, start_min: int, end_min: int) -> bool:
+        """Check if current time is within a range given in minutes since midnight."""
+        current_min = current_time.hour * 60 + current_time.minute
+        if current_min < start_min or current_min > end_min:
+            return False
+        # The end bound is the exact minute, so HH:MM:01 past the end is outside
+        return current_min < end_min or not (current_time.second or current_time.microsecond)
+
+if __name__ == "__main__":
+    print("Testing TradingHoursSessions...")
+    
+    from zoneinfo import ZoneInfo
+    from .rules_hours import TradingHours
+    
+    trading_hours = TradingHours(enable_pre_market=True, allow_pre_market=True)
+    tz = ZoneInfo("America/New_York")
+    for moment in (datetime(2025, 3, 7, 8, 0, tzinfo=tz), datetime(2025, 3, 7, 10, 0, tzinfo=tz)):
+        print(f"âœ… {moment:%H:%M}: within={trading_hours.is_within_trading_hours(moment)}, "
+              f"pre_market={trading_hours.is_pre_market_time(moment)}, regular={trading_hours.is_regular_trading_time(moment)}")
+    
+    print("âœ… TradingHoursSessions test completed!")
@@ -4,11 +4,14 @@ Position Limits Rule
 Handles position size and risk per trade limits.
 """
 
+import sys
 from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Sequence
 from .rules_base import BaseRule, RuleValidator
 
-@dataclass
+_INF = float('inf')
+
+@dataclass(slots=True)
 class PositionLimits(BaseRule):
     """Position size and risk limits."""
     max_position_size: int = 10
@@ -17,7 +20,8 @@ class PositionLimits(BaseRule):
     
     def __post_init__(self):
         """Initialize after dataclass creation."""
-        super().__init__(enabled=True)
+        # Zero-argument super() is unavailable in slots=True dataclasses
+        self.enabled = True
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
@@ -77,21 +81,21 @@ class PositionLimits(BaseRule):
         return trade_risk > self.max_risk_per_trade
     
     def get_remaining_position_capacity(self, current_size: int) -> int:
-        """Get remaining position size capacity."""
+        """Get remaining position size capacity (sys.maxsize when unlimited)."""
         if not self.enabled or self.max_position_size <= 0:
-            return float('inf')
+            return sys.maxsize
         return max(0, self.max_position_size - current_size)
     
     def get_remaining_position_slots(self, current_positions: int) -> int:
-        """Get remaining open position slots."""
+        """Get remaining open position slots (sys.maxsize when unlimited)."""
         if not self.enabled or self.max_open_positions <= 0:
-            return float('inf')
+            return sys.maxsize
         return max(0, self.max_open_positions - current_positions)
     
     def get_remaining_risk_capacity(self, current_risk: float) -> float:
         """Get remaining risk capacity before limit is hit."""
         if not self.enabled or self.max_risk_per_trade <= 0:
-            return float('inf')
+            return _INF
         return max(0, self.max_risk_per_trade - current_risk)
     
     def get_position_utilization(self, current_size: int) -> float:
@@ -115,16 +119,83 @@ class PositionLimits(BaseRule):
     def get_risk_status(self, current_size: int, current_positions: int, 
                        current_risk: float) -> Dict[str, Any]:
         """Get comprehensive risk status for all position limits."""
+        # One pass over local scalars instead of nine helper calls that each re-check enabled
+        enabled = self.enabled
+        max_size = self.max_position_size
+        max_positions = self.max_open_positions
+        max_risk = self.max_risk_per_trade
+        size_active = enabled and max_size > 0
+        positions_active = enabled and max_positions > 0
+        risk_active = enabled and max_risk > 0
+        
+        remaining_size = max_size - current_size
+        remaining_slots = max_positions - current_positions
+        remaining_risk = max_risk - current_risk
+        
         return {
-            "size_exceeded": self.is_position_size_exceeded(current_size),
-            "positions_exceeded": self.is_open_positions_exceeded(current_positions),
-            "risk_exceeded": self.is_risk_per_trade_exceeded(current_risk),
-            "remaining_size": self.get_remaining_position_capacity(current_size),
-            "remaining_slots": self.get_remaining_position_slots(current_positions),
-            "remaining_risk": self.get_remaining_risk_capacity(current_risk),
-            "size_utilization": self.get_position_utilization(current_size),
-            "positions_utilization": self.get_positions_utilization(current_positions),
-            "risk_utilization": self.get_risk_utilization(current_risk)
+            "size_exceeded": size_active and current_size > max_size,
+            "positions_exceeded": positions_active and current_positions >= max_positions,
+            "risk_exceeded": risk_active and current_risk > max_risk,
+            "remaining_size": (remaining_size if remaining_size > 0 else 0) if size_active else sys.maxsize,
+            "remaining_slots": (remaining_slots if remaining_slots > 0 else 0) if positions_active else sys.maxsize,
+            "remaining_risk": (remaining_risk if remaining_risk > 0 else 0) if risk_active else _INF,
+            "size_utilization": (current_size / max_size * 100) if size_active else 0.0,
+            "positions_utilization": (current_positions / max_positions * 100) if positions_active else 0.0,
+            "risk_utilization": (current_risk / max_risk * 100) if risk_active else 0.0
+        }
+    
+    def check_batch(self, sizes: Sequence[int], positions: Sequence[int],
+                    risks: Sequence[float]) -> Dict[str, List[Any]]:
+        """
+        Check the limits against many accounts or candidate trades at once.
+        
+        Row i of each result list matches the same key of
+        get_risk_status(sizes[i], positions[i], risks[i]).
+        
+        Args:
+            sizes: Current position size per row
+            positions: Current open position count per row
+            risks: Current trade risk per row
+        
+        Returns:
+            Exceeded flags and remaining capacities, one list per key
+        """
+        count = len(sizes)
+        enabled = self.enabled
+        max_size = self.max_position_size
+        max_positions = self.max_open_positions
+        max_risk = self.max_risk_per_trade
+        size_active = enabled and max_size > 0
+        positions_active = enabled and max_positions > 0
+        risk_active = enabled and max_risk > 0
+        
+        # Limits that are off never trip and leave unlimited capacity
+        if size_active:
+            size_exceeded = [size > max_size for size in sizes]
+            remaining_size = [max_size - size if size < max_size else 0 for size in sizes]
+        else:
+            size_exceeded = [False] * count
+            remaining_size = [sys.maxsize] * count
+        if positions_active:
+            positions_exceeded = [current >= max_positions for current in positions]
+            remaining_slots = [max_positions - current if current < max_positions else 0 for current in positions]
+        else:
+            positions_exceeded = [False] * count
+            remaining_slots = [sys.maxsize] * count
+        if risk_active:
+            risk_exceeded = [risk > max_risk for risk in risks]
+            remaining_risk = [max_risk - risk if risk < max_risk else 0 for risk in risks]
+        else:
+            risk_exceeded = [False] * count
+            remaining_risk = [_INF] * count
+        
+        return {
+            "size_exceeded": size_exceeded,
+            "positions_exceeded": positions_exceeded,
+            "risk_exceeded": risk_exceeded,
+            "remaining_size": remaining_size,
+            "remaining_slots": remaining_slots,
+            "remaining_risk": remaining_risk
         }
 
 if __name__ == "__main__":
@@ -145,6 +216,10 @@ if __name__ == "__main__":
     status = position_limits.get_risk_status(5, 3, 250.0)
     print(f"âœ… Risk status: {status}")
     
+    # Test batch check
+    batch = position_limits.check_batch([5, 12], [3, 5], [250.0, 600.0])
+    print(f"âœ… Batch check: {batch}")
+    
     # Test to_dict/from_dict
     data = position_limits.to_dict()
     restored = PositionLimits.from_dict(data)
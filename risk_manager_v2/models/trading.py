@@ -4,31 +4,56 @@ Trading Data Models Router
 Routes to different trading data modules.
 """
 
+from collections import defaultdict
 from typing import List, Dict, Any
 from .trading_orders import Order, OrderSide, OrderType, OrderStatus
-from .trading_positions import Position, PositionSide
+from .trading_positions import Position, PositionBook, PositionSide
 from .trading_trades import Trade
 from .trading_base import BaseTradingData
 
 class TradingData:
-    """Complete trading data - aggregates all trading types."""
+    """
+    Complete trading data - aggregates all trading types.
+    
+    Items are indexed by ID as they are added, so add and remove them through
+    the add_*/remove_*/clear_* methods rather than editing the lists directly.
+    """
     
     def __init__(self):
         self.orders = []
         self.positions = []
         self.trades = []
+        
+        # ID -> first item added with that ID, for O(1) lookups
+        self._orders_by_id = {}
+        self._positions_by_id = {}
+        self._trades_by_id = {}
+        
+        # Account ID / symbol -> items in insertion order, for grouped queries without a scan.
+        # Order status and position side change in place, so those groups are still counted on demand.
+        self._orders_by_account = defaultdict(list)
+        self._positions_by_account = defaultdict(list)
+        self._trades_by_account = defaultdict(list)
+        self._trades_by_symbol = defaultdict(list)
     
     def add_order(self, order: Order):
         """Add an order."""
         self.orders.append(order)
+        self._orders_by_id.setdefault(order.order_id, order)
+        self._orders_by_account[order.account_id].append(order)
     
     def add_position(self, position: Position):
         """Add a position."""
         self.positions.append(position)
+        self._positions_by_id.setdefault(position.position_id, position)
+        self._positions_by_account[position.account_id].append(position)
     
     def add_trade(self, trade: Trade):
         """Add a trade."""
         self.trades.append(trade)
+        self._trades_by_id.setdefault(trade.trade_id, trade)
+        self._trades_by_account[trade.account_id].append(trade)
+        self._trades_by_symbol[trade.symbol].append(trade)
     
     def get_pending_orders(self) -> List[Order]:
         """Get all pending orders."""
@@ -38,66 +63,90 @@ class TradingData:
         """Get all open positions."""
         return [pos for pos in self.positions if pos.size > 0]
     
+    def get_position_book(self) -> PositionBook:
+        """Get a column-oriented snapshot of all positions for marking them to market."""
+        return PositionBook.from_positions(self.positions)
+    
     def get_trades_by_symbol(self, symbol: str) -> List[Trade]:
         """Get all trades for a symbol."""
-        return [trade for trade in self.trades if trade.symbol == symbol]
+        return list(self._trades_by_symbol.get(symbol, ()))
     
     def get_orders_by_account(self, account_id: str) -> List[Order]:
         """Get all orders for an account."""
-        return [order for order in self.orders if order.account_id == account_id]
+        return list(self._orders_by_account.get(account_id, ()))
     
     def get_positions_by_account(self, account_id: str) -> List[Position]:
         """Get all positions for an account."""
-        return [pos for pos in self.positions if pos.account_id == account_id]
+        return list(self._positions_by_account.get(account_id, ()))
     
     def get_trades_by_account(self, account_id: str) -> List[Trade]:
         """Get all trades for an account."""
-        return [trade for trade in self.trades if trade.account_id == account_id]
+        return list(self._trades_by_account.get(account_id, ()))
     
     def get_order_by_id(self, order_id: str) -> Order:
         """Get order by ID."""
-        for order in self.orders:
-            if order.order_id == order_id:
-                return order
-        return None
+        return self._orders_by_id.get(order_id)
     
     def get_position_by_id(self, position_id: str) -> Position:
         """Get position by ID."""
-        for position in self.positions:
-            if position.position_id == position_id:
-                return position
-        return None
+        return self._positions_by_id.get(position_id)
     
     def get_trade_by_id(self, trade_id: str) -> Trade:
         """Get trade by ID."""
-        for trade in self.trades:
-            if trade.trade_id == trade_id:
-                return trade
-        return None
+        return self._trades_by_id.get(trade_id)
     
     def remove_order(self, order_id: str):
         """Remove an order by ID."""
-        self.orders = [order for order in self.orders if order.order_id != order_id]
+        # Unknown IDs are answered by the index without scanning the list
+        if self._orders_by_id.pop(order_id, None) is not None:
+            removed = [order for order in self.orders if order.order_id == order_id]
+            self.orders = [order for order in self.orders if order.order_id != order_id]
+            self._drop_from_groups(self._orders_by_account, removed, 'account_id')
     
     def remove_position(self, position_id: str):
         """Remove a position by ID."""
-        self.positions = [pos for pos in self.positions if pos.position_id != position_id]
+        if self._positions_by_id.pop(position_id, None) is not None:
+            removed = [pos for pos in self.positions if pos.position_id == position_id]
+            self.positions = [pos for pos in self.positions if pos.position_id != position_id]
+            self._drop_from_groups(self._positions_by_account, removed, 'account_id')
     
     def remove_trade(self, trade_id: str):
         """Remove a trade by ID."""
-        self.trades = [trade for trade in self.trades if trade.trade_id != trade_id]
+        if self._trades_by_id.pop(trade_id, None) is not None:
+            removed = [trade for trade in self.trades if trade.trade_id == trade_id]
+            self.trades = [trade for trade in self.trades if trade.trade_id != trade_id]
+            self._drop_from_groups(self._trades_by_account, removed, 'account_id')
+            self._drop_from_groups(self._trades_by_symbol, removed, 'symbol')
+    
+    @staticmethod
+    def _drop_from_groups(groups: Dict[Any, List], removed: List, key_attr: str):
+        """Remove items from the groups they were filed under, dropping groups left empty."""
+        gone = {id(item) for item in removed}
+        for key in {getattr(item, key_attr) for item in removed}:
+            remaining = [item for item in groups[key] if id(item) not in gone]
+            if remaining:
+                groups[key] = remaining
+            else:
+                del groups[key]
     
     def clear_orders(self):
         """Clear all orders."""
         self.orders = []
+        self._orders_by_id = {}
+        self._orders_by_account = defaultdict(list)
     
     def clear_positions(self):
         """Clear all positions."""
         self.positions = []
+        self._positions_by_id = {}
+        self._positions_by_account = defaultdict(list)
     
     def clear_trades(self):
         """Clear all trades."""
         self.trades = []
+        self._trades_by_id = {}
+        self._trades_by_account = defaultdict(list)
+        self._trades_by_symbol = defaultdict(list)
     
     def get_trading_summary(self) -> Dict[str, Any]:
         """Get comprehensive trading summary."""
@@ -116,7 +165,9 @@ class TradingData:
         """Get count of orders by status."""
         status_counts = {}
         for order in self.orders:
-            status = order.status.name if hasattr(order.status, 'name') else str(order.status)
+            status = getattr(order.status, '_name_', None)
+            if status is None:
+                status = order.status.name if hasattr(order.status, 'name') else str(order.status)
             status_counts[status] = status_counts.get(status, 0) + 1
         return status_counts
     
@@ -124,17 +175,15 @@ class TradingData:
         """Get count of positions by side."""
         side_counts = {}
         for position in self.positions:
-            side = position.side.name if hasattr(position.side, 'name') else str(position.side)
+            side = getattr(position.side, '_name_', None)
+            if side is None:
+                side = position.side.name if hasattr(position.side, 'name') else str(position.side)
             side_counts[side] = side_counts.get(side, 0) + 1
         return side_counts
     
     def _get_trades_by_symbol_count(self) -> Dict[str, int]:
         """Get count of trades by symbol."""
-        symbol_counts = {}
-        for trade in self.trades:
-            symbol = trade.symbol
-            symbol_counts[symbol] = symbol_counts.get(symbol, 0) + 1
-        return symbol_counts
+        return {symbol: len(trades) for symbol, trades in self._trades_by_symbol.items()}
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for storage."""
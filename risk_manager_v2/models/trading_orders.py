@@ -4,12 +4,18 @@ Trading Orders Data Model
 Handles order information and management.
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Dict, Any, Optional
 from datetime import datetime
-from .trading_base import BaseTradingData, OrderSide, OrderType, OrderStatus
+from .trading_base import BaseTradingData, OrderSide, OrderType, OrderStatus, value_lookup
 
-@dataclass
+# Enum members by wire value, built once for from_dict
+_ORDER_SIDE_BY_VALUE = value_lookup(OrderSide)
+_ORDER_TYPE_BY_VALUE = value_lookup(OrderType)
+_ORDER_STATUS_BY_VALUE = value_lookup(OrderStatus)
+
+@dataclass(slots=True)
 class Order(BaseTradingData):
     """Order information."""
     order_id: str
@@ -44,9 +50,9 @@ class Order(BaseTradingData):
             "account_id": self.account_id,
             "contract_id": self.contract_id,
             "symbol_id": self.symbol_id,
-            "status": self.status.value,
-            "order_type": self.order_type.value,
-            "side": self.side.value,
+            "status": self.status._value_,
+            "order_type": self.order_type._value_,
+            "side": self.side._value_,
             "size": self.size,
             "limit_price": self.limit_price,
             "stop_price": self.stop_price,
@@ -65,11 +71,11 @@ class Order(BaseTradingData):
         return cls(
             order_id=data["order_id"],
             account_id=data["account_id"],
-            contract_id=data["contract_id"],
+            contract_id=sys.intern(data["contract_id"]),
             symbol_id=data["symbol_id"],
-            status=OrderStatus(data.get("status", 0)),
-            order_type=OrderType(data.get("order_type", 0)),
-            side=OrderSide(data.get("side", 0)),
+            status=_ORDER_STATUS_BY_VALUE(data.get("status", 0)),
+            order_type=_ORDER_TYPE_BY_VALUE(data.get("order_type", 0)),
+            side=_ORDER_SIDE_BY_VALUE(data.get("side", 0)),
             size=data.get("size", 0),
             limit_price=data.get("limit_price"),
             stop_price=data.get("stop_price"),
@@ -149,9 +155,9 @@ class Order(BaseTradingData):
             "account_id": self.account_id,
             "contract_id": self.contract_id,
             "symbol_id": self.symbol_id,
-            "status": self.status.name,
-            "order_type": self.order_type.name,
-            "side": self.side.name,
+            "status": self.status._name_,
+            "order_type": self.order_type._name_,
+            "side": self.side._name_,
             "size": self.size,
             "remaining_size": self.get_remaining_size(),
             "fill_percentage": self.get_fill_percentage(),
@@ -4,12 +4,17 @@ Trading Positions Data Model
 Handles position information and management.
 """
 
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+import sys
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterable, List, Mapping, Optional, Sequence
 from datetime import datetime
-from .trading_base import BaseTradingData, PositionSide
+from .trading_base import BaseTradingData, PositionSide, value_lookup
 
-@dataclass
+# Enum members by wire value, built once for from_dict
+_POSITION_SIDE_BY_VALUE = value_lookup(PositionSide)
+
+@dataclass(slots=True)
 class Position(BaseTradingData):
     """Position information."""
     position_id: str
@@ -34,7 +39,7 @@ class Position(BaseTradingData):
             "position_id": self.position_id,
             "account_id": self.account_id,
             "contract_id": self.contract_id,
-            "side": self.side.value,
+            "side": self.side._value_,
             "size": self.size,
             "average_price": self.average_price,
             "creation_timestamp": self.creation_timestamp.isoformat(),
@@ -47,8 +52,8 @@ class Position(BaseTradingData):
         return cls(
             position_id=data["position_id"],
             account_id=data["account_id"],
-            contract_id=data["contract_id"],
-            side=PositionSide(data.get("side", 0)),
+            contract_id=sys.intern(data["contract_id"]),
+            side=_POSITION_SIDE_BY_VALUE(data.get("side", 0)),
             size=data.get("size", 0),
             average_price=data.get("average_price", 0.0),
             creation_timestamp=datetime.fromisoformat(data.get("creation_timestamp", datetime.now().isoformat())),
@@ -98,7 +103,7 @@ class Position(BaseTradingData):
             "position_id": self.position_id,
             "account_id": self.account_id,
             "contract_id": self.contract_id,
-            "side": self.side.name,
+            "side": self.side._name_,
             "size": self.size,
             "average_price": self.average_price,
             "creation_timestamp": self.creation_timestamp.isoformat(),
@@ -108,6 +113,98 @@ class Position(BaseTradingData):
             "is_flat": self.is_flat()
         }
 
+@dataclass(slots=True)
+class PositionBook:
+    """Column-oriented snapshot of positions for marking a whole book to market.
+    
+    Positions change in place, so build a book from the current positions and
+    reuse it across price ticks until they change.
+    """
+    position_ids: List[str] = field(default_factory=list)
+    account_ids: List[str] = field(default_factory=list)
+    contract_ids: List[str] = field(default_factory=list)
+    sizes: array = field(default_factory=lambda: array('d'))
+    avg_prices: array = field(default_factory=lambda: array('d'))
+    # +1 long, -1 short, 0 when the position contributes no P&L (flat or undefined side)
+    side_signs: array = field(default_factory=lambda: array('b'))
+    _rows: Dict[str, int] = field(default_factory=dict, repr=False)
+    
+    @classmethod
+    def from_positions(cls, positions: Iterable[Position]) -> 'PositionBook':
+        """Build a book with one row per position, in order."""
+        book = cls()
+        for position in positions:
+            book.add(position)
+        return book
+    
+    def add(self, position: Position):
+        """Append a position as a new row."""
+        side = position.side
+        size = position.size
+        if size > 0 and side is PositionSide.LONG:
+            sign = 1
+        elif size > 0 and side is PositionSide.SHORT:
+            sign = -1
+        else:
+            sign = 0
+        
+        self._rows.setdefault(position.position_id, len(self.position_ids))
+        self.position_ids.append(position.position_id)
+        self.account_ids.append(position.account_id)
+        self.contract_ids.append(position.contract_id)
+        self.sizes.append(size)
+        self.avg_prices.append(position.average_price)
+        self.side_signs.append(sign)
+    
+    def __len__(self) -> int:
+        return len(self.position_ids)
+    
+    def row_of(self, position_id: str) -> Optional[int]:
+        """Row of the first position added with this ID, or None."""
+        return self._rows.get(position_id)
+    
+    def unrealized_pnl(self, prices: Sequence[float]) -> List[float]:
+        """
+        Unrealized P&L per row, equal to Position.get_unrealized_pnl for each row.
+        
+        Args:
+            prices: Current price per row, aligned with the rows
+        
+        Returns:
+            P&L per row
+        """
+        return [(price - avg_price) * size * sign if sign else 0.0
+                for price, avg_price, size, sign in zip(prices, self.avg_prices, self.sizes, self.side_signs)]
+    
+    def mark_to_market(self, prices_by_contract: Mapping[str, float]) -> float:
+        """
+        Total unrealized P&L of the book.
+        
+        Args:
+            prices_by_contract: Current price per contract ID; every contract in the book must be priced
+        
+        Returns:
+            Sum of the per-row unrealized P&L
+        """
+        return sum(self.unrealized_pnl([prices_by_contract[contract_id] for contract_id in self.contract_ids]), 0.0)
+    
+    def mark_to_market_by_account(self, prices_by_contract: Mapping[str, float]) -> Dict[str, float]:
+        """
+        Unrealized P&L of the book per account.
+        
+        Args:
+            prices_by_contract: Current price per contract ID; every contract in the book must be priced
+        
+        Returns:
+            Account ID -> sum of its rows' unrealized P&L, in order of first appearance
+        """
+        pnl = self.unrealized_pnl([prices_by_contract[contract_id] for contract_id in self.contract_ids])
+        totals: Dict[str, float] = {}
+        get = totals.get
+        for account_id, row_pnl in zip(self.account_ids, pnl):
+            totals[account_id] = get(account_id, 0.0) + row_pnl
+        return totals
+
 if __name__ == "__main__":
     print("Testing Position model...")
     
@@ -138,6 +235,10 @@ if __name__ == "__main__":
     pnl = position.get_unrealized_pnl(current_price)
     print(f"âœ… Unrealized P&L at ${current_price}: ${pnl}")
     
+    # Test book mark-to-market
+    book = PositionBook.from_positions([position])
+    print(f"âœ… Book P&L at ${current_price}: ${book.mark_to_market({position.contract_id: current_price})}")
+    
     print("âœ… Position model test completed!")
 
 
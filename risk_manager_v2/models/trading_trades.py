@@ -4,12 +4,16 @@ Trading Trades Data Model
 Handles trade information and management.
 """
 
+import sys
 from dataclasses import dataclass
 from typing import Dict, Any, Optional
 from datetime import datetime
-from .trading_base import BaseTradingData, OrderSide
+from .trading_base import BaseTradingData, OrderSide, value_lookup
 
-@dataclass
+# Enum members by wire value, built once for from_dict
+_ORDER_SIDE_BY_VALUE = value_lookup(OrderSide)
+
+@dataclass(slots=True)
 class Trade(BaseTradingData):
     """Trade information."""
     trade_id: str
@@ -39,7 +43,7 @@ class Trade(BaseTradingData):
             "symbol": self.symbol,
             "price": self.price,
             "size": self.size,
-            "side": self.side.value,
+            "side": self.side._value_,
             "profit_and_loss": self.profit_and_loss,
             "fees": self.fees,
             "voided": self.voided,
@@ -53,11 +57,11 @@ class Trade(BaseTradingData):
         return cls(
             trade_id=data["trade_id"],
             account_id=data["account_id"],
-            contract_id=data["contract_id"],
+            contract_id=sys.intern(data["contract_id"]),
             symbol=data["symbol"],
             price=data.get("price", 0.0),
             size=data.get("size", 0),
-            side=OrderSide(data.get("side", 0)),
+            side=_ORDER_SIDE_BY_VALUE(data.get("side", 0)),
             profit_and_loss=data.get("profit_and_loss"),
             fees=data.get("fees", 0.0),
             voided=data.get("voided", False),
@@ -123,7 +127,7 @@ class Trade(BaseTradingData):
             "symbol": self.symbol,
             "price": self.price,
             "size": self.size,
-            "side": self.side.name,
+            "side": self.side._name_,
             "profit_and_loss": self.profit_and_loss,
             "fees": self.fees,
             "voided": self.voided,
@@ -0,0 +1,37 @@
+﻿"""
+Clock utilities.
+
+Provides cheap timestamps for hot paths that only need whole-second precision.
+"""
+
+import time
+from datetime import datetime, timezone
+
+# (epoch second, ISO string) for the most recent second formatted
+_last_iso = (0, "")
+
+def now_iso() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string at whole-second resolution.
+
+    The string is formatted at most once per second and shared by every caller
+    within that second. Use datetime.now() directly where sub-second precision matters.
+
+    Returns:
+        ISO 8601 timestamp such as '2025-01-21T16:13:52+00:00'
+    """
+    global _last_iso
+    seconds = int(time.time())
+    cached = _last_iso
+    if cached[0] != seconds:
+        cached = _last_iso = (seconds, datetime.fromtimestamp(seconds, timezone.utc).isoformat())
+    return cached[1]
+
+if __name__ == "__main__":
+    print("Testing clock utilities...")
+
+    first = now_iso()
+    print(f"✅ now_iso(): {first}")
+    print(f"✅ Second call: {now_iso()}")
+
+    print("✅ Clock utilities test completed!")
@@ -8,10 +8,16 @@ import json
 import hashlib
 import threading
 import time
+from collections import OrderedDict
 from typing import Dict, Set, Optional, Any, Callable, List
 from datetime import datetime, timedelta
 from risk_manager_v2.core.logger import get_logger
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = get_logger(__name__)
 
 class IdempotencyStore:
@@ -27,7 +33,8 @@ class IdempotencyStore:
         """
         self.max_keys = max_keys
         self.ttl_hours = ttl_hours
-        self.keys: Dict[str, Dict[str, Any]] = {}
+        # Insertion order is creation order, so expiry only looks at the oldest end
+        self.keys: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self.lock = threading.Lock()
     
     def generate_key(self, action_plan: Dict[str, Any]) -> str:
@@ -40,11 +47,14 @@ class IdempotencyStore:
         Returns:
             Idempotency key string
         """
-        # Create deterministic string representation
-        plan_str = json.dumps(action_plan, sort_keys=True, separators=(',', ':'))
+        # Create deterministic byte representation
+        if orjson is not None:
+            plan_bytes = orjson.dumps(action_plan, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        else:
+            plan_bytes = json.dumps(action_plan, sort_keys=True, separators=(',', ':')).encode()
         
         # Generate SHA1 hash
-        return hashlib.sha1(plan_str.encode()).hexdigest()
+        return hashlib.sha1(plan_bytes).hexdigest()
     
     def is_processed(self, key: str) -> bool:
         """
@@ -90,13 +100,15 @@ class IdempotencyStore:
                     logger.warning(f"Idempotency: key {key[:8]} already being processed")
                     return False
             
-            # Mark as processing
+            # Mark as processing (a retried failed key moves to the newest end)
+            now = datetime.utcnow()
             self.keys[key] = {
                 'status': 'processing',
                 'action_plan': action_plan,
-                'created_at': datetime.utcnow(),
-                'updated_at': datetime.utcnow()
+                'created_at': now,
+                'updated_at': now
             }
+            self.keys.move_to_end(key)
             
             logger.info(f"Idempotency: marked key {key[:8]} as processing")
             return True
@@ -138,31 +150,26 @@ class IdempotencyStore:
                 logger.warning(f"Idempotency: marked key {key[:8]} as failed: {error}")
     
     def _cleanup_expired(self):
-        """Remove expired keys."""
+        """Remove expired keys, oldest first, stopping at the first live key."""
+        keys = self.keys
         cutoff_time = datetime.utcnow() - timedelta(hours=self.ttl_hours)
         
-        expired_keys = [
-            key for key, entry in self.keys.items()
-            if entry['created_at'] < cutoff_time
-        ]
-        
-        for key in expired_keys:
-            del self.keys[key]
-        
-        if expired_keys:
-            logger.debug(f"Idempotency: cleaned up {len(expired_keys)} expired keys")
-        
-        # Enforce max keys limit
-        if len(self.keys) > self.max_keys:
-            # Remove oldest keys
-            sorted_keys = sorted(
-                self.keys.items(),
-                key=lambda x: x[1]['created_at']
-            )
-            
-            keys_to_remove = len(self.keys) - self.max_keys
-            for key, _ in sorted_keys[:keys_to_remove]:
-                del self.keys[key]
+        expired_count = 0
+        while keys:
+            oldest = next(iter(keys.values()))
+            if oldest['created_at'] >= cutoff_time:
+                break
+            keys.popitem(last=False)
+            expired_count += 1
+        
+        if expired_count:
+            logger.debug(f"Idempotency: cleaned up {expired_count} expired keys")
+        
+        # Enforce max keys limit by dropping the oldest keys
+        keys_to_remove = len(keys) - self.max_keys
+        if keys_to_remove > 0:
+            for _ in range(keys_to_remove):
+                keys.popitem(last=False)
             
             logger.warning(f"Idempotency: removed {keys_to_remove} old keys to stay under limit")
 
@@ -4,16 +4,25 @@ Structured JSON logging utilities.
 Provides structured logging with correlation IDs, idempotency keys, and metrics.
 """
 
-import json
 import logging
+import logging.handlers
 import time
 import uuid
 from datetime import datetime
 from typing import Any, Dict, Optional, List
 from risk_manager_v2.core.logger import get_logger
+from risk_manager_v2.utils.log_handlers import BatchedMemoryHandler
+from risk_manager_v2.utils.log_serialize import dumps, to_json_value
 
 logger = get_logger(__name__)
 
+_SEVERITY_LEVELS = {
+    'ERROR': logging.ERROR,
+    'WARNING': logging.WARNING,
+    'INFO': logging.INFO,
+    'DEBUG': logging.DEBUG
+}
+
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
     
@@ -61,7 +70,7 @@ class JSONFormatter(logging.Formatter):
                           'exc_text', 'stack_info']:
                 log_entry[key] = value
         
-        return json.dumps(log_entry, default=str)
+        return dumps(log_entry, default=to_json_value)
 
 class StructuredLogger:
     """Structured logger with correlation and idempotency tracking."""
@@ -76,17 +85,26 @@ class StructuredLogger:
         """
         self.logger = logging.getLogger(name)
         self.correlation_id = correlation_id or self._generate_correlation_id()
+        self._prefix_cache = None
         self.start_time = time.time()
         self.metrics = {}
     
+    def _correlation_prefix(self) -> str:
+        """Get the pre-encoded '{"correlation_id":...,' prefix for log payloads."""
+        cached = self._prefix_cache
+        if cached is None or cached[0] is not self.correlation_id:
+            prefix = '{"correlation_id":' + dumps(self.correlation_id) + ','
+            cached = self._prefix_cache = (self.correlation_id, prefix)
+        return cached[1]
+    
     def _generate_correlation_id(self) -> str:
         """Generate correlation ID."""
         return f"corr_{uuid.uuid4().hex[:16]}"
     
-    def _generate_idempotency_key(self, data: Dict) -> str:
+    def _generate_idempotency_key(self, data: Any) -> str:
         """Generate idempotency key from data."""
         import hashlib
-        data_str = json.dumps(data, sort_keys=True)
+        data_str = dumps(data, default=to_json_value, sort_keys=True)
         return f"idem_{hashlib.md5(data_str.encode()).hexdigest()[:16]}"
     
     def log_event(self, event: str, severity: str = "INFO", **kwargs):
@@ -98,25 +116,27 @@ class StructuredLogger:
             severity: Log severity
             **kwargs: Additional event data
         """
+        # Nothing to build or serialize if this severity would be filtered out
+        level = _SEVERITY_LEVELS.get(severity.upper(), logging.INFO)
+        if not self.logger.isEnabledFor(level):
+            return
+        
         log_data = {
             'event': event,
             'severity': severity,
-            'correlation_id': self.correlation_id,
             'latency_ms': int((time.time() - self.start_time) * 1000),
             **kwargs
         }
         
-        if severity.upper() == 'ERROR':
-            self.logger.error(json.dumps(log_data))
-        elif severity.upper() == 'WARNING':
-            self.logger.warning(json.dumps(log_data))
-        elif severity.upper() == 'DEBUG':
-            self.logger.debug(json.dumps(log_data))
+        if 'correlation_id' in kwargs:
+            message = dumps(log_data, default=to_json_value)
         else:
-            self.logger.info(json.dumps(log_data))
+            # The correlation ID is constant per logger: splice in its pre-encoded prefix
+            message = self._correlation_prefix() + dumps(log_data, default=to_json_value)[1:]
+        self.logger.log(level, message)
     
     def log_risk_event(self, account_id: str, rule: str, decision: str, 
-                      action_plan: Optional[Dict] = None, **kwargs):
+                      action_plan: Optional[Any] = None, **kwargs):
         """
         Log risk management event.
         
@@ -124,7 +144,7 @@ class StructuredLogger:
             account_id: Account ID
             rule: Rule that was evaluated
             decision: Decision made
-            action_plan: Action plan if applicable
+            action_plan: Action plan if applicable (dict or engine ActionPlan, encoded as-is)
             **kwargs: Additional event data
         """
         log_data = {
@@ -313,14 +333,22 @@ class RiskLogger:
                                         **kwargs)
 
 def setup_json_logging(logger_name: str, log_file: str = None, 
-                      log_level: str = "INFO") -> StructuredLogger:
+                      log_level: str = "INFO", buffer_capacity: int = 256,
+                      flush_interval: float = 1.0) -> StructuredLogger:
     """
     Setup JSON logging.
     
+    File output is appended one JSON line per event to a daily-rotated file.
+    Records are buffered in memory and written out when the buffer fills, a
+    WARNING-or-higher record arrives, or flush_interval seconds have passed since
+    the oldest buffered record; each flush is a single write to the file.
+    
     Args:
         logger_name: Logger name
         log_file: Log file path (optional)
         log_level: Log level
+        buffer_capacity: Number of records buffered before writing to the file
+        flush_interval: Longest time in seconds a record waits in the buffer
     
     Returns:
         Configured structured logger
@@ -338,9 +366,17 @@ def setup_json_logging(logger_name: str, log_file: str = None,
     
     # Add file handler if specified
     if log_file:
-        file_handler = logging.FileHandler(log_file)
+        file_handler = logging.handlers.TimedRotatingFileHandler(
+            log_file, when='midnight', encoding='utf-8'
+        )
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        buffered_handler = BatchedMemoryHandler(
+            capacity=buffer_capacity,
+            flushLevel=logging.WARNING,
+            target=file_handler,
+            flush_interval=flush_interval
+        )
+        logger.addHandler(buffered_handler)
     
     return StructuredLogger(logger_name)
 
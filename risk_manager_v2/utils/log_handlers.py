@@ -0,0 +1,132 @@
+﻿"""
+Batched log handlers.
+
+Provides a buffering handler that hands a whole batch of records to a file in one write.
+"""
+
+import logging
+import logging.handlers
+import threading
+from typing import List, Optional
+
+class BatchedMemoryHandler(logging.handlers.MemoryHandler):
+    """MemoryHandler that writes each flushed batch to its file target in a single write."""
+
+    def __init__(self, capacity: int, flushLevel: int = logging.ERROR, target: Optional[logging.Handler] = None,
+                 flushOnClose: bool = True, flush_interval: Optional[float] = None):
+        """
+        Initialize the handler.
+
+        Args:
+            capacity: Number of records buffered before a flush
+            flushLevel: Records at or above this level flush immediately
+            target: Handler that receives the flushed records
+            flushOnClose: Flush the buffer when the handler is closed
+            flush_interval: Seconds after the oldest buffered record at which the
+                buffer is flushed regardless of size or level (None disables)
+        """
+        super().__init__(capacity, flushLevel=flushLevel, target=target, flushOnClose=flushOnClose)
+        self.flush_interval = flush_interval
+        self._flush_timer: Optional[threading.Timer] = None
+
+    def emit(self, record: logging.LogRecord):
+        """Buffer a record, starting the interval timer when it is the first one buffered."""
+        super().emit(record)
+        if self.flush_interval and self.buffer and self._flush_timer is None:
+            timer = threading.Timer(self.flush_interval, self.flush)
+            timer.daemon = True
+            self._flush_timer = timer
+            timer.start()
+
+    def flush(self):
+        """
+        Format all buffered records and write them to the target stream at once.
+
+        The stock MemoryHandler hands records over one at a time, and StreamHandler
+        flushes after each, so a batch of N records costs N write syscalls. Targets
+        that are not stream handlers fall back to the stock per-record behaviour.
+        """
+        self.acquire()
+        try:
+            timer = self._flush_timer
+            if timer is not None:
+                self._flush_timer = None
+                timer.cancel()
+            target = self.target
+            if not self.buffer or target is None:
+                return
+            if not isinstance(target, logging.StreamHandler):
+                super().flush()
+                return
+
+            rotating = isinstance(target, logging.handlers.BaseRotatingHandler)
+            chunk: List[str] = []
+            for record in self.buffer:
+                # Keep rollover semantics: write what belongs to the old file first
+                if rotating and target.shouldRollover(record):
+                    self._write_chunk(target, chunk, record)
+                    chunk = []
+                    target.acquire()
+                    try:
+                        target.doRollover()
+                    finally:
+                        target.release()
+                if target.filter(record):
+                    chunk.append(target.format(record) + target.terminator)
+
+            self._write_chunk(target, chunk, self.buffer[-1])
+            self.buffer.clear()
+        finally:
+            self.release()
+
+    @staticmethod
+    def _write_chunk(target: logging.StreamHandler, chunk: List[str], record: logging.LogRecord):
+        """
+        Write pre-formatted lines to the target stream with one write and one flush.
+
+        Args:
+            target: Stream handler that owns the file
+            chunk: Formatted lines, each already terminated
+            record: Record reported through handleError if the write fails
+        """
+        if not chunk:
+            return
+
+        target.acquire()
+        try:
+            if target.stream is None and isinstance(target, logging.FileHandler):
+                target.stream = target._open()  # opened lazily when delay=True
+            target.stream.write(''.join(chunk))
+            target.stream.flush()
+        except Exception:
+            target.handleError(record)
+        finally:
+            target.release()
+
+if __name__ == "__main__":
+    import os
+    import tempfile
+
+    print("Testing batched log handlers...")
+
+    log_path = os.path.join(tempfile.mkdtemp(), "events.jsonl")
+    handler = BatchedMemoryHandler(capacity=3, target=logging.FileHandler(log_path))
+    test_logger = logging.getLogger("batched_handler_test")
+    test_logger.addHandler(handler)
+    test_logger.setLevel(logging.INFO)
+
+    for i in range(3):
+        test_logger.info(f"event {i}")
+
+    with open(log_path) as f:
+        print(f"✅ Lines written in one batch: {len(f.readlines())}")
+
+    import time
+    handler.flush_interval = 0.1
+    test_logger.info("event 3")
+    time.sleep(0.3)
+
+    with open(log_path) as f:
+        print(f"✅ Lines written after the flush interval: {len(f.readlines())}")
+
+    print("✅ Batched log handlers test completed!")
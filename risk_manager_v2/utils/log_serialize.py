@@ -0,0 +1,61 @@
+﻿"""
+Log serialization helpers.
+
+Provides the compact JSON encoding used by the structured loggers.
+"""
+
+import dataclasses
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def to_json_value(obj: Any) -> Any:
+    """
+    Fallback encoder for values JSON cannot represent directly.
+    
+    Dataclass instances (such as the engine's EvaluationContext and ActionPlan) become
+    dicts; orjson encodes them natively and never calls this for them. Anything else
+    is logged as its string form.
+    
+    Args:
+        obj: Value to convert
+    
+    Returns:
+        JSON-serializable value
+    """
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    return str(obj)
+
+def dumps(data: Any, default=None, sort_keys: bool = False) -> str:
+    """
+    Serialize data to a compact JSON string.
+    
+    Uses orjson when it is installed and falls back to the standard library.
+    
+    Args:
+        data: Data to serialize
+        default: Callable for objects that are not natively serializable
+        sort_keys: Sort object keys for a deterministic encoding
+    
+    Returns:
+        Compact JSON string
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS if sort_keys else orjson.OPT_NON_STR_KEYS
+        return orjson.dumps(data, default=default, option=option).decode('utf-8')
+    return json.dumps(data, default=default, sort_keys=sort_keys, separators=(',', ':'))
+
+if __name__ == "__main__":
+    from datetime import datetime
+
+    print("Testing log serialization helpers...")
+
+    print(f"✅ Encoded: {dumps({'b': 2, 'a': 1}, sort_keys=True)}")
+    print(f"✅ Fallback: {dumps({'at': datetime(2024, 1, 2)}, default=to_json_value)}")
+
+    print("✅ Log serialization helpers test completed!")
@@ -6,7 +6,7 @@ Handles trading hours, session windows, and market timing logic.
 
 from datetime import datetime, time, timedelta
 from typing import Optional, List, Dict, Any
-import pytz
+from zoneinfo import ZoneInfo
 from risk_manager_v2.core.logger import get_logger
 
 logger = get_logger(__name__)
@@ -28,7 +28,7 @@ class TradingSession:
         self.name = name
         self.start_time = self._parse_time(start_time)
         self.end_time = self._parse_time(end_time)
-        self.timezone = pytz.timezone(timezone)
+        self.timezone = ZoneInfo(timezone)
     
     def _parse_time(self, time_str: str) -> time:
         """Parse time string to time object."""
@@ -43,7 +43,7 @@ class TradingSession:
         if check_time is None:
             check_time = datetime.now(self.timezone)
         elif check_time.tzinfo is None:
-            check_time = self.timezone.localize(check_time)
+            check_time = check_time.replace(tzinfo=self.timezone)
         
         current_time = check_time.time()
         
@@ -58,7 +58,7 @@ class TradingSession:
         if check_time is None:
             check_time = datetime.now(self.timezone)
         elif check_time.tzinfo is None:
-            check_time = self.timezone.localize(check_time)
+            check_time = check_time.replace(tzinfo=self.timezone)
         
         # Get next occurrence of start time
         next_start = check_time.replace(
@@ -79,7 +79,7 @@ class TradingSession:
         if check_time is None:
             check_time = datetime.now(self.timezone)
         elif check_time.tzinfo is None:
-            check_time = self.timezone.localize(check_time)
+            check_time = check_time.replace(tzinfo=self.timezone)
         
         # Get today's end time
         today_end = check_time.replace(
@@ -100,7 +100,7 @@ class TradingSession:
         if check_time is None:
             check_time = datetime.now(self.timezone)
         elif check_time.tzinfo is None:
-            check_time = self.timezone.localize(check_time)
+            check_time = check_time.replace(tzinfo=self.timezone)
         
         if not self.is_active(check_time):
             return {
@@ -156,7 +156,7 @@ class TradingCalendar:
         Args:
             timezone: Default timezone
         """
-        self.timezone = pytz.timezone(timezone)
+        self.timezone = ZoneInfo(timezone)
         self.sessions = {}
     
     def add_session(self, name: str, start_time: str, end_time: str):